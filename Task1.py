@@ -1,4 +1,8 @@
-from datetime import datetime
+from array import array
+from collections.abc import Callable, Iterable
+from datetime import date as _date, datetime, tzinfo
+
+from dates import parse_date
 
 # This function calculates the number of days between the given date and today
 # The input date should be in the format 'YYYY-MM-DD'
@@ -22,9 +26,155 @@ def get_days_from_today(date:str) -> int | str:
         'Invalid date format'
     """
     try:
-        date = datetime.strptime(date, "%Y-%m-%d").date()
+        date = parse_date(date, "%Y-%m-%d")
         today = datetime.now().date()
         return (today - date).days
     except  (ValueError, TypeError):
         # Return an error message if the date format is invalid
         return "Invalid date format"
+
+
+def get_days_from_today_batch(dates: Iterable[str]) -> tuple[array, array]:
+    """
+    Calculate the number of days between each given date and today.
+
+    "Today" is read once for the whole batch, so every item is measured
+    against the same day even if the batch runs across midnight.
+
+    Args:
+        dates (Iterable[str]): Date strings in the format 'YYYY-MM-DD'.
+
+    Returns:
+        tuple[array, array]: Day deltas (array of 'q') and a validity mask
+        (array of 'b'). Invalid items have delta 0 and mask 0 instead of
+        the "Invalid date format" string returned by get_days_from_today.
+
+    Examples:
+        >>> get_days_from_today_batch(["2021-05-04", "not-a-date"])
+        (array('q', [1, 0]), array('b', [1, 0]))  # if today is 2021-05-05
+    """
+    today = datetime.now().date().toordinal()
+    deltas = array("q")
+    mask = array("b")
+    append_delta = deltas.append
+    append_valid = mask.append
+    fromisoformat = _date.fromisoformat
+    for value in dates:
+        # Fixed-width 'YYYY-MM-DD' strings skip strptime and the parse cache; with the
+        # length, ASCII and separator guards fromisoformat accepts exactly what strptime does
+        if type(value) is str and len(value) == 10 and value.isascii() and value[4] == "-" and value[7] == "-":
+            try:
+                append_delta(today - fromisoformat(value).toordinal())
+                append_valid(1)
+                continue
+            except ValueError:
+                pass
+        try:
+            append_delta(today - datetime.strptime(value, "%Y-%m-%d").toordinal())
+            append_valid(1)
+        except (ValueError, TypeError):
+            append_delta(0)
+            append_valid(0)
+    return deltas, mask
+
+def _iso_ordinal(value: str) -> int | None:
+    """Ordinal of a 'YYYY-MM-DD' string, or None if it is not a valid date (cached by parse_date)."""
+    # strptime('%Y-%m-%d') needs four leading digits, two '-' and 8-10 characters in total;
+    # anything else is rejected here without raising (parse_date does not cache errors)
+    if not (8 <= len(value) <= 10 and value[4] == "-" and value[:4].isdigit() and value.count("-") == 2):
+        return None
+    try:
+        return parse_date(value, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+def _invalid(value: object) -> None:
+    return None
+
+class DaysCalculator:
+    """
+    Calculate day deltas against a single snapshot of today.
+
+    The clock is read once when the calculator is created, so a batch that runs across
+    midnight still uses one date. Inputs can be 'YYYY-MM-DD' strings, date or datetime
+    objects, or Unix timestamps (int/float); each type has its own converter, so there
+    is no per-item try/except for non-string values. Strings that do not have the
+    'YYYY-MM-DD' shape are rejected without raising; well-shaped strings go through
+    the shared parse cache. Only well-shaped impossible dates such as '2023-02-30'
+    still raise inside the converter, on every call, as errors are not cached. Subclasses of these types use the converter of
+    their base type; bool is not read as a timestamp.
+
+    Args:
+        tz (tzinfo | None): Time zone of "today" and of timestamps. None means local time.
+        clock (Callable[[], datetime] | None): Returns the current datetime (or date).
+            Defaults to datetime.now(tz); pass a fixed clock in tests.
+
+    Examples:
+        >>> calculator = DaysCalculator(clock=lambda: datetime(2021, 5, 5))
+        >>> calculator.days_from("2021-10-09")
+        -157
+        >>> calculator.days_from_many(["2021-05-04", date(2021, 5, 5), "bad"])
+        [1, 0, 'Invalid date format']
+    """
+
+    def __init__(self, tz: tzinfo | None = None, clock: Callable[[], datetime] | None = None):
+        now = clock() if clock is not None else datetime.now(tz)
+        if isinstance(now, datetime):
+            if tz is not None and now.tzinfo is not None:
+                now = now.astimezone(tz)
+            now = now.date()
+        self.tz = tz
+        self.today = now
+        self._today_ordinal = now.toordinal()
+        self._converters = {
+            str: _iso_ordinal,
+            _date: _date.toordinal,
+            datetime: self._datetime_ordinal,
+            int: self._timestamp_ordinal,
+            float: self._timestamp_ordinal,
+            bool: _invalid,
+        }
+
+    def _converter_for(self, kind: type) -> Callable:
+        """Converter of the nearest supported base type of kind, remembered for the next lookup."""
+        for base in kind.__mro__[1:]:
+            converter = self._converters.get(base)
+            if converter is not None:
+                break
+        else:
+            converter = _invalid
+        self._converters[kind] = converter
+        return converter
+
+    def _datetime_ordinal(self, value: datetime) -> int:
+        if self.tz is not None and value.tzinfo is not None:
+            value = value.astimezone(self.tz)
+        return value.toordinal()
+
+    def _timestamp_ordinal(self, value: float) -> int | None:
+        try:
+            return datetime.fromtimestamp(value, self.tz).toordinal()
+        except (OverflowError, OSError, ValueError):
+            return None
+
+    def days_from(self, value: str | _date | datetime | int | float) -> int | str:
+        """
+        Number of days from value to today (negative if value is in the future),
+        or "Invalid date format" like get_days_from_today.
+        """
+        converter = self._converters.get(type(value)) or self._converter_for(type(value))
+        ordinal = converter(value)
+        if ordinal is None:
+            return "Invalid date format"
+        return self._today_ordinal - ordinal
+
+    def days_from_many(self, values: Iterable[str | _date | datetime | int | float]) -> list[int | str]:
+        """days_from for every value, in order."""
+        today = self._today_ordinal
+        converters = self._converters
+        result = []
+        for value in values:
+            converter = converters.get(type(value)) or self._converter_for(type(value))
+            ordinal = converter(value)
+            result.append("Invalid date format" if ordinal is None else today - ordinal)
+        return result
@@ -1,4 +1,21 @@
 import random
+from array import array
+from collections import namedtuple
+import itertools
+
+def _is_valid_ticket(min: int, max: int, quantity: int) -> bool:
+    """Check the ticket rules shared by get_numbers_ticket and generate_tickets."""
+    if quantity > max - min + 1:
+        return False
+    elif min > max:
+        return False
+    elif min < 1:
+        return False
+    elif quantity < 1:
+        return False
+    elif max > 1000:
+        return False
+    return True
 
 def get_numbers_ticket(min: int, max: int, quantity: int) -> list[int]:
     """
@@ -18,16 +35,195 @@ def get_numbers_ticket(min: int, max: int, quantity: int) -> list[int]:
                        - quantity < 1
                        - max > 1000
     """
-    if quantity > max - min + 1:
-        return []
-    elif min > max:
-        return []
-    elif min < 1:
-        return []
-    elif max > 1000:
+    if not _is_valid_ticket(min, max, quantity):
         return []
     
     nums = random.sample(range(min, max + 1), quantity)
     return sorted(nums)
 
-print(get_numbers_ticket(1, 6, 6))
+# generate_tickets draws in bulk from this many tickets on, and while at least
+# BULK_MIN_ACCEPTANCE of the drawn rows have no repeated number
+BULK_MIN_COUNT = 100
+BULK_MIN_ACCEPTANCE = 0.55
+
+def _draw_values(generator: random.Random, min: int, max: int, size: int) -> bytes | list[int]:
+    """
+    At least size independent uniform numbers in [min, max], made from bulk random bytes.
+    Raw values from the uneven top of the byte range are rejected, so there is no modulo bias.
+    """
+    span = max - min + 1
+    if max < 256:
+        # One byte per value; translate maps and rejects them without a Python loop
+        limit = 256 - 256 % span
+        table = bytes(value % span + min for value in range(256))
+        rejected = bytes(range(limit, 256))
+        values = b""
+        while len(values) < size:
+            values += generator.randbytes((size - len(values)) * 256 // limit + 16).translate(table, rejected)
+        return values
+    limit = 65536 - 65536 % span
+    table = list(range(min, max + 1)) * (65536 // span)
+    values = []
+    while len(values) < size:
+        raw = array('H', generator.randbytes(((size - len(values)) * 65536 // limit + 16) * 2))
+        values += map(table.__getitem__, itertools.compress(raw, map(limit.__gt__, raw)))
+    return values
+
+def generate_tickets(min: int, max: int, quantity: int, count: int, seed: int | None = None) -> array:
+    """
+    Generate many lottery tickets at once.
+
+    Numbers are drawn in bulk from random bytes and cut into rows of quantity numbers;
+    rows with a repeated number are dropped, so every kept row is a uniformly random set.
+    For small batches, or when many rows would repeat a number (quantity close to the
+    range size), tickets are drawn one by one with random.sample instead.
+
+    Args:
+        min (int): The minimum value in the range (inclusive). Must be >= 1.
+        max (int): The maximum value in the range (inclusive). Must be <= 1000 and >= min.
+        quantity (int): The number of unique numbers per ticket. Must be >= 1 and <= (max - min + 1).
+        count (int): The number of tickets to generate.
+        seed (int | None): Seed of the random generator. The same seed gives the same tickets,
+                           so a draw can be reproduced and audited.
+
+    Returns:
+        array: A flat array('H') of count * quantity numbers. Ticket i is
+               result[i * quantity:(i + 1) * quantity], sorted ascending;
+               ticket_rows gives a (count, quantity) view of it.
+               Returns an empty array for the same invalid inputs as get_numbers_ticket
+               or if count < 1.
+    """
+    tickets = array('H')
+    if count < 1 or not _is_valid_ticket(min, max, quantity):
+        return tickets
+
+    generator = random.Random(seed)
+    span = max - min + 1
+    # Chance that quantity independent draws are all different
+    acceptance = 1.0
+    for drawn in range(quantity):
+        acceptance *= (span - drawn) / span
+    if count < BULK_MIN_COUNT or acceptance < BULK_MIN_ACCEPTANCE:
+        # Reuse one generator and one population for the whole batch
+        sample = generator.sample
+        population = range(min, max + 1)
+        for _ in range(count):
+            tickets.extend(sorted(sample(population, quantity)))
+        return tickets
+
+    total = count * quantity
+    while len(tickets) < total:
+        needed = count - len(tickets) // quantity
+        values = _draw_values(generator, min, max, (int(needed / acceptance * 1.1) + 8) * quantity)
+        # Cut the values into rows with map/slice, so there is no Python loop per ticket
+        stops = range(quantity, len(values) + 1, quantity)
+        rows = map(values.__getitem__, map(slice, range(0, stops.stop - quantity, quantity), stops))
+        rows = list(map(sorted, map(set, rows)))
+        # A row that lost numbers to set() had a repeat and is dropped
+        kept = itertools.compress(rows, map(quantity.__eq__, map(len, rows)))
+        tickets.extend(itertools.chain.from_iterable(itertools.islice(kept, needed)))
+    return tickets
+
+def ticket_rows(tickets: array, quantity: int) -> memoryview:
+    """
+    View the flat result of generate_tickets as a (count, quantity) table without copying.
+
+    Use view.tolist() for a list of rows or view[i, j] for one number. The tickets array
+    cannot be resized while the view is alive. memoryview has no shape with a zero in it,
+    so an empty array gives a plain empty view.
+    """
+    if not tickets:
+        return memoryview(tickets)
+    return memoryview(tickets).cast('B').cast(tickets.typecode, (len(tickets) // quantity, quantity))
+
+# Tickets between two saved generator states of a TicketService stream
+CHECKPOINT_INTERVAL = 1024
+
+TicketRecord = namedtuple("TicketRecord", "seed worker stream position min max quantity numbers")
+TicketRecord.__doc__ = "One issued ticket and everything needed to draw it again."
+
+def _stream_seed(seed: int, worker: int, stream: int) -> int:
+    """
+    Pack the stream coordinates into one integer seed. worker and stream must be
+    below 2**32 and seed must not be negative (random.seed drops the sign).
+    """
+    if seed < 0:
+        raise ValueError("seed must not be negative")
+    if not 0 <= worker < 2 ** 32 or not 0 <= stream < 2 ** 32:
+        raise ValueError("worker and stream must be between 0 and 2**32 - 1")
+    return (seed << 64) | (worker << 32) | stream
+
+class TicketService:
+    """
+    Issue lottery tickets from many threads without sharing a random generator.
+
+    Every thread gets its own stream number and a generator seeded once from
+    (seed, worker, stream), so the tickets of a stream are a reproducible sequence.
+    Every CHECKPOINT_INTERVAL tickets the generator state is saved, and replay redraws
+    a recorded ticket from the nearest checkpoint. Give every process its own worker
+    number to keep streams of different processes apart.
+    """
+
+    def __init__(self, seed: int | None = None, worker: int = 0, record: bool = True):
+        # threading is the only import random does not already load
+        import threading
+
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        _stream_seed(self.seed, worker, 0)
+        self.worker = worker
+        self.record = record
+        self.records: list[TicketRecord] = []
+        self._streams = itertools.count()
+        self._local = threading.local()
+        # stream -> its records in position order, and (stream, position) -> generator state before that ticket
+        self._stream_records: dict[int, list[TicketRecord]] = {}
+        self._checkpoints: dict[tuple[int, int], tuple] = {}
+
+    def _thread_stream(self):
+        local = self._local
+        if not hasattr(local, "stream"):
+            local.stream = next(self._streams)
+            local.position = 0
+            local.random = random.Random(_stream_seed(self.seed, self.worker, local.stream))
+            local.records = self._stream_records[local.stream] = []
+        return local
+
+    def issue(self, min: int, max: int, quantity: int) -> list[int]:
+        """
+        Draw one ticket with the same rules as get_numbers_ticket.
+        Invalid requests return [] and are not recorded (nor drawn).
+        """
+        if not _is_valid_ticket(min, max, quantity):
+            return []
+        local = self._thread_stream()
+        position = local.position
+        local.position += 1
+        if self.record and position % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints[local.stream, position] = local.random.getstate()
+        numbers = sorted(local.random.sample(range(min, max + 1), quantity))
+        if self.record:
+            ticket = TicketRecord(self.seed, self.worker, local.stream, position, min, max, quantity, numbers)
+            local.records.append(ticket)
+            self.records.append(ticket)
+        return numbers
+
+    def replay(self, record: TicketRecord) -> list[int]:
+        """
+        Draw the ticket described by record again, starting from the nearest checkpoint
+        and redrawing the recorded tickets of its stream up to it.
+
+        Raises:
+            ValueError: If the record was not issued by this service.
+        """
+        stream_records = self._stream_records.get(record.stream, ())
+        if record.seed != self.seed or record.worker != self.worker or record.position >= len(stream_records):
+            raise ValueError("record was not issued by this service")
+        start = record.position - record.position % CHECKPOINT_INTERVAL
+        generator = random.Random()
+        generator.setstate(self._checkpoints[record.stream, start])
+        for earlier in stream_records[start:record.position]:
+            generator.sample(range(earlier.min, earlier.max + 1), earlier.quantity)
+        return sorted(generator.sample(range(record.min, record.max + 1), record.quantity))
+
+if __name__ == '__main__':
+    print(get_numbers_ticket(1, 6, 6))
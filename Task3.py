@@ -1,4 +1,67 @@
-import re
+from collections import namedtuple
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import islice
+
+@cache
+def _phone_tokens():
+    """
+    Digit runs and plus signs that are not glued to a digit or another plus,
+    matched together so the input is scanned only once. Compiled on first use.
+    """
+    import re
+    return re.compile(r"\d+|(?<![\d+])\+")
+
+# Status codes returned by validate_phones. Codes below PHONE_EMPTY are accepted by normalize_phone.
+PHONE_VALID = 0
+PHONE_PREFIX_00 = 1        # '00' international prefix with at least 9 digits after it
+PHONE_PREFIX_00_SHORT = 2  # '00' prefix is accepted without a length check, but fewer than 9 digits follow
+PHONE_EMPTY = 3            # no digits at all
+PHONE_TOO_SHORT = 4
+PHONE_TOO_LONG = 5
+PHONE_STATUS_NAMES = ("valid", "prefix_00", "prefix_00_short", "empty", "too_short", "too_long")
+
+def _phone_status(ints: str) -> tuple[bool, str, int]:
+    """
+    Split the joined digits (and valid plus signs) into whether there was a plus sign,
+    the digits alone and the status code of the normalization rules.
+    """
+    # Check if there is a valid plus sign (not part of a digit sequence)
+    has_valid_plus = '+' in ints
+    if has_valid_plus:
+        ints = ints.replace('+', '')
+
+    # International prefix '00' is accepted without a length check
+    if ints.startswith("00"):
+        return has_valid_plus, ints, PHONE_PREFIX_00 if len(ints) - 2 >= 9 else PHONE_PREFIX_00_SHORT
+
+    # The number is too short or too long
+    if not ints:
+        return has_valid_plus, ints, PHONE_EMPTY
+    elif len(ints) < 9:
+        return has_valid_plus, ints, PHONE_TOO_SHORT
+    elif len(ints) > 12:
+        return has_valid_plus, ints, PHONE_TOO_LONG
+    return has_valid_plus, ints, PHONE_VALID
+
+def _normalize_tokens(ints: str) -> str:
+    """Apply the normalization rules to the joined digits (and valid plus signs)."""
+    has_valid_plus, ints, status = _phone_status(ints)
+
+    # Handle international prefix '00' (replace with '+')
+    if status == PHONE_PREFIX_00 or status == PHONE_PREFIX_00_SHORT:
+        return "+" + ints[2:]
+
+    # If the number is too short or too long, return empty string
+    if status != PHONE_VALID:
+        return ''
+
+    # If there was a valid plus sign, return '+' and the digits
+    if has_valid_plus:
+        return '+' + ints
+
+    code = '+380'
+    return code[:(13 - len(ints))] + ints
 
 def normalize_phone(phone_number: str) -> str:
     """
@@ -15,25 +78,234 @@ def normalize_phone(phone_number: str) -> str:
         str: The normalized phone number in the format '+380XXXXXXXXX' or similar,
              or an empty string if the number is invalid (too short/long).
     """
-    # Check if there is a valid plus sign (not part of a digit sequence)
-    has_valid_plus = bool(re.search(r'(^|[^\d+])\+', phone_number))
-    # Extract all digit sequences from the input
-    nums = re.findall(r"\d+", phone_number)
-    ints = ''.join(nums)
+    # Extract digit sequences and valid plus signs in a single scan
+    return _normalize_tokens(''.join(_phone_tokens().findall(phone_number)))
 
-    # Handle international prefix '00' (replace with '+')
-    if ints.startswith("00"):
-        return "+" + ints[2:]
+def normalize_phones(phone_numbers: Iterable[str]) -> list[str]:
+    """
+    Normalize many phone numbers at once.
 
-    # If the number is too short or too long, return empty string
-    if len(ints) < 9:
-        return ''
-    elif len(ints) > 12:
-        return ''
+    Same rules as normalize_phone, with the compiled pattern and helpers
+    bound once for the whole batch.
 
-    # If there was a valid plus sign, return '+' and the digits
-    if has_valid_plus:
-        return '+' + ints
+    Args:
+        phone_numbers (Iterable[str]): Input phone numbers in any format.
 
-    code = '+380'
-    return code[:(13 - len(ints))] + ints
\ No newline at end of file
+    Returns:
+        list[str]: Normalized numbers in input order ('' for invalid numbers).
+    """
+    findall = _phone_tokens().findall
+    join = ''.join
+    return [_normalize_tokens(join(findall(phone_number))) for phone_number in phone_numbers]
+
+def validate_phones(phone_numbers: Iterable[str]) -> tuple[bytearray, dict[str, int]]:
+    """
+    Check many phone numbers without building the normalized strings.
+
+    Args:
+        phone_numbers (Iterable[str]): Input phone numbers in any format.
+
+    Returns:
+        tuple[bytearray, dict[str, int]]: One status code per input (PHONE_VALID ... PHONE_TOO_LONG)
+        and the number of inputs per status name (see PHONE_STATUS_NAMES).
+        normalize_phone returns '' exactly for the codes PHONE_EMPTY and above.
+    """
+    findall = _phone_tokens().findall
+    join = ''.join
+    statuses = bytearray()
+    counts = [0] * len(PHONE_STATUS_NAMES)
+    for phone_number in phone_numbers:
+        status = _phone_status(join(findall(phone_number)))[2]
+        statuses.append(status)
+        counts[status] += 1
+    return statuses, dict(zip(PHONE_STATUS_NAMES, counts))
+
+# Lines handed to a worker process at a time by normalize_phones_unique
+UNIQUE_CHUNK_SIZE = 50_000
+
+def _normalize_unique_chunk(phone_numbers: list[str]) -> tuple[set[str], int]:
+    """Normalize one chunk and return its unique numbers and the count of rejected inputs."""
+    unique = set()
+    rejected = 0
+    for phone in normalize_phones(phone_numbers):
+        if phone:
+            unique.add(phone)
+        else:
+            rejected += 1
+    return unique, rejected
+
+def _read_chunks(path: str, chunk_size: int) -> Iterator[list[str]]:
+    """Yield non-blank lines of a text file in lists of up to chunk_size."""
+    with open(path, encoding="utf-8") as file:
+        lines = (line for line in file if not line.isspace())
+        while chunk := list(islice(lines, chunk_size)):
+            yield chunk
+
+def normalize_phones_unique(path: str, workers: int = 1, chunk_size: int = UNIQUE_CHUNK_SIZE) -> tuple[set[str], int]:
+    """
+    Normalize a file of raw phone numbers (one per line) and drop duplicates.
+
+    The file is read in chunks. With more than one worker, chunks are normalized in
+    worker processes (at most two chunks per worker in flight, so memory stays bounded)
+    and the per-chunk sets are merged.
+
+    Args:
+        path (str): Text file with one raw phone number per line. Blank lines are skipped.
+        workers (int): Number of worker processes; 1 normalizes in this process.
+        chunk_size (int): Number of lines per chunk.
+
+    Returns:
+        tuple[set[str], int]: The unique normalized numbers and the number of rejected inputs.
+    """
+    unique: set[str] = set()
+    rejected = 0
+    if workers <= 1:
+        for chunk in _read_chunks(path, chunk_size):
+            chunk_unique, chunk_rejected = _normalize_unique_chunk(chunk)
+            unique |= chunk_unique
+            rejected += chunk_rejected
+        return unique, rejected
+
+    # Imported here so the serial path does not pay for concurrent.futures
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in _read_chunks(path, chunk_size):
+            pending.add(executor.submit(_normalize_unique_chunk, chunk))
+            if len(pending) < workers * 2:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_unique, chunk_rejected = future.result()
+                unique |= chunk_unique
+                rejected += chunk_rejected
+        for future in pending:
+            chunk_unique, chunk_rejected = future.result()
+            unique |= chunk_unique
+            rejected += chunk_rejected
+    return unique, rejected
+
+PhoneRule = namedtuple("PhoneRule", "country code trunk_prefix national_lengths")
+PhoneRule.__doc__ = "Numbering rule of one country."
+
+# Country codes, trunk prefixes and valid national number lengths (without trunk prefix)
+PHONE_RULES = (
+    PhoneRule("UA", "380", "0", (9,)),
+    PhoneRule("US", "1", "1", (10,)),
+    PhoneRule("GB", "44", "0", (9, 10)),
+    PhoneRule("DE", "49", "0", (6, 7, 8, 9, 10, 11)),
+    PhoneRule("FR", "33", "0", (9,)),
+    PhoneRule("IT", "39", "", (6, 7, 8, 9, 10, 11)),
+    PhoneRule("ES", "34", "", (9,)),
+    PhoneRule("PL", "48", "", (9,)),
+    PhoneRule("CZ", "420", "", (9,)),
+    PhoneRule("SK", "421", "0", (9,)),
+    PhoneRule("HU", "36", "06", (8, 9)),
+    PhoneRule("RO", "40", "0", (9,)),
+    PhoneRule("MD", "373", "0", (8,)),
+    PhoneRule("LT", "370", "8", (8,)),
+    PhoneRule("LV", "371", "", (8,)),
+    PhoneRule("EE", "372", "", (7, 8)),
+    PhoneRule("BY", "375", "80", (9,)),
+    PhoneRule("GE", "995", "0", (9,)),
+    PhoneRule("TR", "90", "0", (10,)),
+    PhoneRule("IL", "972", "0", (8, 9)),
+    PhoneRule("RU", "7", "8", (10,)),
+    PhoneRule("CN", "86", "0", (10, 11)),
+    PhoneRule("IN", "91", "0", (10,)),
+    PhoneRule("JP", "81", "0", (9, 10)),
+    PhoneRule("AU", "61", "0", (9,)),
+)
+
+@cache
+def _country_trie() -> dict:
+    """Digit trie of country codes; a node's None key holds the rule ending there. Built on first use."""
+    trie: dict = {}
+    for rule in PHONE_RULES:
+        node = trie
+        for digit in rule.code:
+            node = node.setdefault(digit, {})
+        node.setdefault(None, rule)
+    return trie
+
+@cache
+def _rules_by_country() -> dict:
+    return {rule.country: rule for rule in PHONE_RULES}
+
+def _match_country(digits: str) -> PhoneRule | None:
+    """Walk the country code trie along the digits and return the matching rule."""
+    node = _country_trie()
+    for digit in digits:
+        node = node.get(digit)
+        if node is None:
+            return None
+        rule = node.get(None)
+        if rule is not None:
+            return rule
+    return None
+
+def _national_number(rule: PhoneRule, national: str) -> str:
+    """Strip the trunk prefix and check the length. Returns '' if invalid."""
+    # The trunk prefix goes first: for some countries the number with it still has a valid length
+    if rule.trunk_prefix and national.startswith(rule.trunk_prefix) \
+            and len(national) - len(rule.trunk_prefix) in rule.national_lengths:
+        return national[len(rule.trunk_prefix):]
+    if len(national) in rule.national_lengths:
+        return national
+    return ''
+
+def classify_phone(phone_number: str, default_country: str = "UA") -> tuple[str, str]:
+    """
+    Find the country of a phone number and normalize it with that country's rules.
+
+    Numbers written with '+' or the '00' prefix are matched by country code; other numbers
+    are read as national numbers of default_country (with or without its country code
+    or trunk prefix).
+
+    Args:
+        phone_number (str): The input phone number in any format.
+        default_country (str): Country code (e.g. 'UA') for numbers without '+' or '00'.
+
+    Returns:
+        tuple[str, str]: The country (e.g. 'UA') and the number in '+<code><national>' format,
+                         or ('', '') if the number is not valid for any known rule.
+
+    Raises:
+        ValueError: If default_country is not in PHONE_RULES.
+    """
+    has_valid_plus, ints, status = _phone_status(''.join(_phone_tokens().findall(phone_number)))
+
+    if has_valid_plus or status == PHONE_PREFIX_00 or status == PHONE_PREFIX_00_SHORT:
+        if not has_valid_plus:
+            ints = ints[2:]
+        rule = _match_country(ints)
+        if rule is None:
+            return '', ''
+        national = _national_number(rule, ints[len(rule.code):])
+    else:
+        rule = _rules_by_country().get(default_country)
+        if rule is None:
+            raise ValueError(f"unknown country: {default_country!r}")
+        national = ''
+        if ints.startswith(rule.code):
+            national = _national_number(rule, ints[len(rule.code):])
+        if not national:
+            national = _national_number(rule, ints)
+
+    if not national:
+        return '', ''
+    return rule.country, '+' + rule.code + national
+
+def normalize_phone_international(phone_number: str, default_country: str = "UA") -> str:
+    """
+    Normalize a phone number using the per-country rules in PHONE_RULES.
+
+    Args:
+        phone_number (str): The input phone number in any format.
+        default_country (str): Country code (e.g. 'UA') for numbers without '+' or '00'.
+
+    Returns:
+        str: The number in '+<code><national>' format, or an empty string if it is invalid.
+    """
+    return classify_phone(phone_number, default_country)[1]
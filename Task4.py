@@ -1,10 +1,21 @@
-from datetime import datetime, timedelta
-from typing import List, Dict
+import sys
+from array import array
+from bisect import bisect_right
 from calendar import isleap
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+from dates import parse_date
+
+# csv, json and concurrent.futures are imported inside the functions that need them,
+# so importing this module for get_upcoming_birthdays stays cheap.
 
 def parse_birthday(birthday_str: str) -> datetime.date:
     """Parse birthday string into date object."""
-    return datetime.strptime(birthday_str, "%Y.%m.%d").date()
+    return parse_date(birthday_str, "%Y.%m.%d")
 
 def get_birthday_this_year(birthday: datetime.date, today: datetime.date) -> datetime.date:
     """
@@ -41,7 +52,156 @@ def adjust_weekend_date(date: datetime.date) -> datetime.date:
         return date + timedelta(days=1)
     return date
 
-def get_upcoming_birthdays(users: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def _window_days(today: datetime.date, days: int = 7):
+    """
+    Yield ((month, day), occurrence) for every day of the upcoming window.
+    In non-leap years February 28th also covers February 29th birthdays,
+    the same way get_birthday_this_year does.
+    """
+    for offset in range(days + 1):
+        occurrence = today + timedelta(days=offset)
+        yield (occurrence.month, occurrence.day), occurrence
+        if occurrence.month == 2 and occurrence.day == 28 and not isleap(occurrence.year):
+            yield (2, 29), occurrence
+
+class BirthdayPolicy:
+    """
+    Rules for the upcoming-birthdays window and for moving congratulations off days off.
+
+    window_days: how many days after today are included (today is always included).
+    weekend_days: weekday numbers (Monday is 0) on which nobody is congratulated.
+    holidays: dates on which nobody is congratulated.
+    saturday_feb28_next_day: keep the adjust_weekend_date special case that moves
+        a Saturday February 28th by one day only.
+
+    The default policy gives exactly the results of adjust_weekend_date.
+    Policies are immutable and hashable (they are cache keys of congratulation_table).
+    """
+    __slots__ = ("window_days", "weekend_days", "holidays", "saturday_feb28_next_day")
+
+    def __init__(self, window_days: int = 7, weekend_days: Iterable[int] = frozenset({5, 6}),
+                 holidays: Iterable[datetime.date] = frozenset(), saturday_feb28_next_day: bool = True):
+        weekend_days = frozenset(weekend_days)
+        if not 0 <= window_days <= 365:
+            raise ValueError("window_days must be between 0 and 365")
+        if len(weekend_days) >= 7 or not weekend_days <= set(range(7)):
+            raise ValueError("weekend_days must be weekday numbers 0-6 and leave at least one business day")
+        for name, value in zip(self.__slots__, (window_days, weekend_days, frozenset(holidays), saturday_feb28_next_day)):
+            object.__setattr__(self, name, value)
+
+    def _fields(self) -> tuple:
+        return self.window_days, self.weekend_days, self.holidays, self.saturday_feb28_next_day
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not BirthdayPolicy:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return "BirthdayPolicy(" + ", ".join(f"{name}={value!r}" for name, value in zip(self.__slots__, self._fields())) + ")"
+
+    def __reduce__(self):
+        # Policies are sent to worker processes
+        return BirthdayPolicy, self._fields()
+
+    def congratulation_date(self, date: datetime.date) -> datetime.date:
+        """Move the date forward to the next day that is neither a weekend day nor a holiday."""
+        if self.saturday_feb28_next_day and date.month == 2 and date.day == 28 \
+                and date.weekday() == 5 and 5 in self.weekend_days:
+            date += timedelta(days=1)
+            # The special case only skips the weekend check; a holiday still moves the date on
+            if date not in self.holidays:
+                return date
+        while date.weekday() in self.weekend_days or date in self.holidays:
+            date += timedelta(days=1)
+        return date
+
+DEFAULT_POLICY = BirthdayPolicy()
+
+@lru_cache(maxsize=16)
+def congratulation_table(today: datetime.date, policy: BirthdayPolicy = DEFAULT_POLICY) -> Mapping[tuple, datetime.date]:
+    """
+    Map every (month, day) birthday inside the policy's window starting today to its
+    congratulation date. Birthdays missing from the table are outside the window.
+    The table is cached per day and policy, so it is rebuilt only when the date
+    rolls over; it is returned as a read-only view, because every caller shares it.
+    """
+    table = {}
+    for key, occurrence in _window_days(today, policy.window_days):
+        # Long windows can see a day twice; the first one is the next birthday
+        if key not in table:
+            table[key] = policy.congratulation_date(occurrence)
+    return MappingProxyType(table)
+
+@lru_cache(maxsize=16)
+def _congratulation_strings(today: datetime.date, policy: BirthdayPolicy = DEFAULT_POLICY) -> dict[tuple, str]:
+    """congratulation_table with the dates already formatted as 'YYYY.MM.DD'."""
+    return {key: value.strftime("%Y.%m.%d") for key, value in congratulation_table(today, policy).items()}
+
+def format_dates(ordinals: Iterable[int]) -> list[str]:
+    """
+    Format date ordinals as 'YYYY.MM.DD' strings. Each distinct date is formatted once,
+    which is cheap for upcoming-birthday results (only a handful of dates per window).
+    """
+    strings: dict[int, str] = {}
+    result = []
+    for ordinal in ordinals:
+        string = strings.get(ordinal)
+        if string is None:
+            string = strings[ordinal] = date.fromordinal(ordinal).strftime("%Y.%m.%d")
+        result.append(string)
+    return result
+
+def iter_upcoming_birthdays(users: Iterable[dict[str, str]], today: datetime.date = None,
+                            policy: BirthdayPolicy = DEFAULT_POLICY) -> Iterator[dict[str, str]]:
+    """
+    Yield users whose birthdays are within the next 7 days (including today), one at a time.
+    Same rules and result format as get_upcoming_birthdays, but users can come from any
+    iterable (e.g. a file reader), so memory use does not grow with the input.
+    A policy changes the window length, weekend days and holidays.
+    """
+    if today is None:
+        today = datetime.today().date()
+
+    table = _congratulation_strings(today, policy)
+
+    for user in users:
+        # Parse the user's birthday
+        birthday = parse_birthday(user["birthday"])
+        
+        # Skip users with future birth dates (not yet born)
+        if birthday > today:
+            continue
+        
+        # Look up the weekend-adjusted date of the next birthday, if it is within 7 days
+        congratulation_date = table.get((birthday.month, birthday.day))
+        if congratulation_date is not None:
+            yield {
+                "name": user["name"],
+                "congratulation_date": congratulation_date
+            }
+
+# Below this many users get_upcoming_birthdays stays serial even when workers are requested,
+# because starting a process pool costs more than the work itself.
+PARALLEL_THRESHOLD = 50_000
+
+def _get_upcoming_birthdays_chunk(users: list[dict[str, str]], today: datetime.date,
+                                  policy: BirthdayPolicy) -> list[dict[str, str]]:
+    """Process one shard of users in a worker process."""
+    return list(iter_upcoming_birthdays(users, today, policy))
+
+def get_upcoming_birthdays(users: list[dict[str, str]], workers: int = 1,
+                           parallel_threshold: int = PARALLEL_THRESHOLD,
+                           policy: BirthdayPolicy = DEFAULT_POLICY) -> list[dict[str, str]]:
     """
     Returns a list of users whose birthdays are within the next 7 days (including today).
     If a birthday falls on a weekend, the congratulation date is moved to the next Monday.
@@ -49,36 +209,486 @@ def get_upcoming_birthdays(users: List[Dict[str, str]]) -> List[Dict[str, str]]:
     
     Args:
         users: List of dictionaries with keys 'name' (str) and 'birthday' (str, format 'YYYY.MM.DD').
+        workers: Number of worker processes. With more than one worker and at least
+            parallel_threshold users, the list is split into shards processed in parallel.
+            All workers use the same "today", and results keep the order of users.
+        parallel_threshold: Minimum number of users for the parallel mode.
+        policy: Window length, weekend days and holidays (default: 7 days, Saturday/Sunday).
     Returns:
         List of dictionaries with keys 'name' and 'congratulation_date' (str).
     """
     today = datetime.today().date()
+    if workers <= 1 or len(users) < parallel_threshold:
+        return list(iter_upcoming_birthdays(users, today, policy))
+
+    # Imported only for the parallel path, so serial calls never load concurrent.futures
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A few shards per worker keeps the pool busy when shards take uneven time
+    shard_size = -(-len(users) // (workers * 4))
+    shards = [users[start:start + shard_size] for start in range(0, len(users), shard_size)]
     upcoming_birthdays = []
-    
-    for user in users:
-        # Parse the user's birthday
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_result in executor.map(_get_upcoming_birthdays_chunk, shards,
+                                         [today] * len(shards), [policy] * len(shards)):
+            upcoming_birthdays.extend(shard_result)
+    return upcoming_birthdays
+
+class UpcomingColumns:
+    """
+    Columnar upcoming-birthdays result: parallel arrays of user indices ('L') and
+    congratulation date ordinals ('l'). Names and date strings are only produced
+    when asked for, using one formatted string per distinct date.
+    """
+    __slots__ = ("indices", "ordinals", "_name_at")
+
+    def __init__(self, indices: array, ordinals: array, name_at):
+        self.indices = indices
+        self.ordinals = ordinals
+        self._name_at = name_at
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def names(self) -> list[str]:
+        """Names of the users in the result."""
+        name_at = self._name_at
+        return [name_at(index) for index in self.indices]
+
+    def dates(self) -> list[str]:
+        """Congratulation dates as 'YYYY.MM.DD' strings."""
+        return format_dates(self.ordinals)
+
+    def to_dicts(self) -> list[dict[str, str]]:
+        """The result in the get_upcoming_birthdays format."""
+        return [
+            {"name": name, "congratulation_date": congratulation_date}
+            for name, congratulation_date in zip(self.names(), self.dates())
+        ]
+
+def get_upcoming_birthdays_columnar(users: list[dict[str, str]], today: datetime.date = None,
+                                    policy: BirthdayPolicy = DEFAULT_POLICY) -> UpcomingColumns:
+    """
+    Same selection as get_upcoming_birthdays, returned as UpcomingColumns (indices into users
+    and date ordinals) instead of a list of new dictionaries with formatted dates.
+    """
+    if today is None:
+        today = datetime.today().date()
+    table = {key: value.toordinal() for key, value in congratulation_table(today, policy).items()}
+
+    indices = array("L")
+    ordinals = array("l")
+    for index, user in enumerate(users):
         birthday = parse_birthday(user["birthday"])
-        
         # Skip users with future birth dates (not yet born)
         if birthday > today:
             continue
-        
-        # Get birthday date this year
-        birthday_this_year = get_birthday_this_year(birthday, today)
-        
-        # If the birthday has already passed this year, use next year
-        if birthday_this_year < today:
-            birthday_this_year = get_birthday_next_year(birthday, today)
-        
-        # Check if birthday is within next 7 days
-        days_diff = (birthday_this_year - today).days
-        if days_diff <= 7:
-            # Adjust for weekends
-            congratulation_date = adjust_weekend_date(birthday_this_year)
-            
-            upcoming_birthdays.append({
-                "name": user["name"],
-                "congratulation_date": congratulation_date.strftime("%Y.%m.%d")
-            })
-    
-    return upcoming_birthdays
+        ordinal = table.get((birthday.month, birthday.day))
+        if ordinal is not None:
+            indices.append(index)
+            ordinals.append(ordinal)
+    return UpcomingColumns(indices, ordinals, lambda index: users[index]["name"])
+
+def read_users(path: str) -> Iterator[dict[str, str]]:
+    """
+    Stream users from a CSV file (with 'name' and 'birthday' columns) or a JSONL file
+    (one {"name": ..., "birthday": ...} object per line), one user at a time.
+    The format is chosen by the file extension: '.csv' or '.jsonl'.
+    """
+    import csv
+    import json
+
+    if not path.endswith((".csv", ".jsonl")):
+        raise ValueError(f"unsupported users file format: {path!r}")
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(file):
+                yield {"name": row["name"], "birthday": row["birthday"]}
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+def write_upcoming_birthdays(input_path: str, output_path: str) -> int:
+    """
+    Stream users from input_path and write their upcoming congratulation dates to output_path
+    as CSV or JSONL (chosen by the output file extension). Returns the number of rows written.
+    """
+    import csv
+    import json
+
+    if not output_path.endswith((".csv", ".jsonl")):
+        raise ValueError(f"unsupported output file format: {output_path!r}")
+    today = datetime.today().date()
+    written = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as file:
+        if output_path.endswith(".csv"):
+            writer = csv.DictWriter(file, fieldnames=["name", "congratulation_date"])
+            writer.writeheader()
+            write = writer.writerow
+        else:
+            write = lambda row: file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        for row in iter_upcoming_birthdays(read_users(input_path), today):
+            write(row)
+            written += 1
+    return written
+
+class BirthdayIndex:
+    """
+    Users bucketed by (month, day) of their birthday.
+
+    The index is built once and kept up to date with add/remove, so an
+    upcoming-birthdays query only touches the buckets inside the window
+    instead of re-parsing every user.
+    """
+
+    def __init__(self, users: list[dict[str, str]] = ()):
+        self._buckets: dict[tuple, list[tuple]] = {}
+        self._size = 0
+        for user in users:
+            self.add(user)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, user: dict[str, str]) -> None:
+        """Add a user with keys 'name' and 'birthday' (format 'YYYY.MM.DD')."""
+        birthday = parse_birthday(user["birthday"])
+        self._buckets.setdefault((birthday.month, birthday.day), []).append((user["name"], birthday))
+        self._size += 1
+
+    def remove(self, user: dict[str, str]) -> None:
+        """Remove a previously added user. Raises ValueError if the user is not indexed."""
+        birthday = parse_birthday(user["birthday"])
+        key = (birthday.month, birthday.day)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            raise ValueError(f"user {user['name']!r} is not in the index")
+        bucket.remove((user["name"], birthday))
+        if not bucket:
+            del self._buckets[key]
+        self._size -= 1
+
+    def users_on(self, month: int, day: int) -> tuple[tuple[str, datetime.date], ...]:
+        """Return (name, birthday) of the users born on month/day, in the order they were added."""
+        return tuple(self._buckets.get((month, day), ()))
+
+    def get_upcoming_birthdays(self, today: datetime.date = None,
+                               policy: BirthdayPolicy = DEFAULT_POLICY) -> list[dict[str, str]]:
+        """
+        Same result as get_upcoming_birthdays for the indexed users,
+        ordered by birthday date.
+        """
+        if today is None:
+            today = datetime.today().date()
+        upcoming_birthdays = []
+
+        for key, congratulation_date in congratulation_table(today, policy).items():
+            bucket = self._buckets.get(key)
+            if not bucket:
+                continue
+            congratulation_date = congratulation_date.strftime("%Y.%m.%d")
+            for name, birthday in bucket:
+                # Skip users with future birth dates (not yet born)
+                if birthday > today:
+                    continue
+                upcoming_birthdays.append({"name": name, "congratulation_date": congratulation_date})
+
+        return upcoming_birthdays
+
+class UpcomingBirthdaysTracker:
+    """
+    Keeps the current upcoming-birthdays result and reports only what changes.
+
+    advance moves the window to a new day and rebuilds only the buckets of the days
+    that entered it, plus the days that stayed but whose congratulation date changed
+    or whose users' birth dates were passed over (people born in between); the buckets
+    of the days that left are dropped. add and remove update a single user.
+    Every change is returned as ("added" | "removed", {"name": ..., "congratulation_date": ...}).
+    """
+
+    def __init__(self, users: Iterable[dict[str, str]] = (), today: datetime.date = None,
+                 policy: BirthdayPolicy = DEFAULT_POLICY):
+        self.index = BirthdayIndex(users)
+        self.policy = policy
+        self.today = today if today is not None else datetime.today().date()
+        self._table = congratulation_table(self.today, policy)
+        self._results = {key: self._bucket_results(key) for key in self._table}
+
+    def _bucket_results(self, key: tuple) -> list[tuple]:
+        """(name, birthday, congratulation_date) for users of one bucket inside the window."""
+        congratulation_date = self._table[key].strftime("%Y.%m.%d")
+        return [
+            (name, birthday, congratulation_date)
+            for name, birthday in self.index.users_on(*key)
+            # Skip users with future birth dates (not yet born)
+            if birthday <= self.today
+        ]
+
+    @staticmethod
+    def _event(kind: str, entry: tuple) -> tuple:
+        name, _, congratulation_date = entry
+        return kind, {"name": name, "congratulation_date": congratulation_date}
+
+    def results(self) -> list[dict[str, str]]:
+        """The current upcoming birthdays, same as BirthdayIndex.get_upcoming_birthdays."""
+        return [
+            {"name": name, "congratulation_date": congratulation_date}
+            for entries in self._results.values()
+            for name, _, congratulation_date in entries
+        ]
+
+    def advance(self, today: datetime.date = None) -> list[tuple]:
+        """Move the window to today and return the added/removed events."""
+        if today is None:
+            today = datetime.today().date()
+        if today == self.today:
+            return []
+        old_today, old_table = self.today, self._table
+        self.today = today
+        self._table = table = congratulation_table(today, self.policy)
+
+        # Birth dates the move passed over: users born in between are now born (or not yet)
+        low, high = sorted((old_today, today))
+        if (high - low).days > 366:
+            crossed = None
+        else:
+            crossed = set()
+            for offset in range(1, (high - low).days + 1):
+                day = low + timedelta(days=offset)
+                crossed.add((day.month, day.day))
+
+        events = []
+        results = self._results
+        # Days that left the window
+        for key in [key for key in results if key not in table]:
+            events.extend(self._event("removed", entry) for entry in results.pop(key))
+        for key, congratulation_date in table.items():
+            old_entries = results.get(key)
+            # A day that stayed keeps its users unless its date moved or a birth date was passed over
+            if old_entries is not None and old_table[key] == congratulation_date \
+                    and crossed is not None and key not in crossed:
+                continue
+            new_entries = self._bucket_results(key)
+            if old_entries is None:
+                events.extend(self._event("added", entry) for entry in new_entries)
+            else:
+                old_counts = Counter(old_entries)
+                new_counts = Counter(new_entries)
+                events.extend(self._event("removed", entry) for entry in (old_counts - new_counts).elements())
+                events.extend(self._event("added", entry) for entry in (new_counts - old_counts).elements())
+            results[key] = new_entries
+        # Keep the buckets in window order
+        self._results = {key: results[key] for key in table}
+        return events
+
+    def add(self, user: dict[str, str]) -> list[tuple]:
+        """Add a user and return the events it causes."""
+        self.index.add(user)
+        birthday = parse_birthday(user["birthday"])
+        key = (birthday.month, birthday.day)
+        if key not in self._table or birthday > self.today:
+            return []
+        entry = (user["name"], birthday, self._table[key].strftime("%Y.%m.%d"))
+        self._results[key].append(entry)
+        return [self._event("added", entry)]
+
+    def remove(self, user: dict[str, str]) -> list[tuple]:
+        """Remove a user and return the events it causes. Raises ValueError if the user is unknown."""
+        self.index.remove(user)
+        birthday = parse_birthday(user["birthday"])
+        key = (birthday.month, birthday.day)
+        if key not in self._table or birthday > self.today:
+            return []
+        entry = (user["name"], birthday, self._table[key].strftime("%Y.%m.%d"))
+        self._results[key].remove(entry)
+        return [self._event("removed", entry)]
+
+    def update(self, old_user: dict[str, str], new_user: dict[str, str]) -> list[tuple]:
+        """
+        Replace a user (e.g. after a name or birthday edit) and return the events it causes.
+        An invalid new_user raises before anything is removed.
+        """
+        # Check the new user first, so an invalid edit leaves the tracker unchanged
+        parse_birthday(new_user["birthday"])
+        if "name" not in new_user:
+            raise KeyError("name")
+        return self.remove(old_user) + self.add(new_user)
+
+class BirthdayCalendar:
+    """
+    Date-range queries over the users' congratulation dates.
+
+    Users are kept in 366 (month, day) slots sorted by birth year. For every year that is
+    queried, the congratulation counts of all slots (after the policy's weekend/holiday
+    shift) are turned into a prefix-sum array, so counting any range costs O(1) per year
+    it touches, and listing a range costs O(days + size of the output).
+    """
+
+    def __init__(self, users: Iterable[dict[str, str]] = (), policy: BirthdayPolicy = DEFAULT_POLICY):
+        self.policy = policy
+        self._slots: dict[tuple, tuple[list[int], list[str]]] = {}
+        self._prefix_sums: dict[int, tuple[int, array]] = {}
+        # Longest possible shift: every weekend day and holiday in a row, plus one
+        self._max_shift = len(policy.weekend_days) + len(policy.holidays) + 1
+        for user in users:
+            self.add(user)
+
+    def add(self, user: dict[str, str]) -> None:
+        """Add a user with keys 'name' and 'birthday' (format 'YYYY.MM.DD')."""
+        birthday = parse_birthday(user["birthday"])
+        years, names = self._slots.setdefault((birthday.month, birthday.day), ([], []))
+        position = bisect_right(years, birthday.year)
+        years.insert(position, birthday.year)
+        names.insert(position, user["name"])
+        self._prefix_sums.clear()
+
+    def _occurrences(self, year: int) -> Iterator[tuple[tuple, datetime.date]]:
+        """Yield (slot, birthday date in year) for every used slot."""
+        for month, day in self._slots:
+            if month == 2 and day == 29 and not isleap(year):
+                yield (month, day), date(year, 2, 28)
+            else:
+                yield (month, day), date(year, month, day)
+
+    def _year_prefix_sums(self, year: int) -> tuple[int, array]:
+        """
+        Prefix sums of congratulation counts for birthdays in year.
+        Index i covers days up to base + i - 1, where base is January 1st of year.
+        """
+        cached = self._prefix_sums.get(year)
+        if cached is not None:
+            return cached
+        base = date(year, 1, 1).toordinal()
+        counts = [0] * (367 + self._max_shift)
+        for slot, occurrence in self._occurrences(year):
+            # Only users already born by their birthday in this year are congratulated
+            born = bisect_right(self._slots[slot][0], year)
+            if born:
+                counts[self.policy.congratulation_date(occurrence).toordinal() - base] += born
+        prefix_sums = array("q", [0])
+        total = 0
+        for count in counts:
+            total += count
+            prefix_sums.append(total)
+        self._prefix_sums[year] = base, prefix_sums
+        return base, prefix_sums
+
+    def count(self, start: datetime.date, end: datetime.date) -> int:
+        """Number of congratulations with dates from start to end (inclusive)."""
+        if end < start:
+            return 0
+        first, last = start.toordinal(), end.toordinal()
+        total = 0
+        # Birthdays late in the previous year can be moved into the range
+        for year in range(start.year - 1, end.year + 1):
+            base, prefix_sums = self._year_prefix_sums(year)
+            low = min(max(first - base, 0), len(prefix_sums) - 1)
+            high = min(max(last - base + 1, 0), len(prefix_sums) - 1)
+            total += prefix_sums[high] - prefix_sums[low]
+        return total
+
+    def counts_by_day(self, start: datetime.date, end: datetime.date) -> dict[datetime.date, int]:
+        """Number of congratulations on every day from start to end (inclusive)."""
+        result = {}
+        day = start
+        while day <= end:
+            result[day] = self.count(day, day)
+            day += timedelta(days=1)
+        return result
+
+    def between(self, start: datetime.date, end: datetime.date) -> list[dict[str, str]]:
+        """
+        Everyone congratulated from start to end (inclusive), ordered by congratulation date,
+        in the get_upcoming_birthdays format.
+        """
+        result = []
+        occurrence = start - timedelta(days=self._max_shift)
+        while occurrence <= end:
+            congratulation_date = self.policy.congratulation_date(occurrence)
+            if start <= congratulation_date <= end:
+                keys = [(occurrence.month, occurrence.day)]
+                if occurrence.month == 2 and occurrence.day == 28 and not isleap(occurrence.year):
+                    keys.append((2, 29))
+                formatted = congratulation_date.strftime("%Y.%m.%d")
+                for key in keys:
+                    slot = self._slots.get(key)
+                    if slot is None:
+                        continue
+                    years, names = slot
+                    for name in names[:bisect_right(years, occurrence.year)]:
+                        result.append({"name": name, "congratulation_date": formatted})
+            occurrence += timedelta(days=1)
+        result.sort(key=lambda item: item["congratulation_date"])
+        return result
+
+class UserStore:
+    """
+    Columnar storage for users: interned names in one list, birthdays packed
+    into array buffers (year, and month/day as month * 32 + day).
+
+    Upcoming-birthday queries run directly on the columns and return index views;
+    result dictionaries and date strings are only built by format_upcoming.
+    """
+
+    def __init__(self, users: Iterable[dict[str, str]] = ()):
+        self.names: list[str] = []
+        self.years = array("H")
+        self.month_days = array("H")
+        for user in users:
+            self.append(user["name"], user["birthday"])
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, name: str, birthday_str: str) -> None:
+        """Add a user with a birthday string in 'YYYY.MM.DD' format."""
+        birthday = parse_birthday(birthday_str)
+        self.names.append(sys.intern(name))
+        self.years.append(birthday.year)
+        self.month_days.append(birthday.month * 32 + birthday.day)
+
+    def upcoming_indices(self, today: datetime.date = None,
+                         policy: BirthdayPolicy = DEFAULT_POLICY) -> tuple[array, array]:
+        """
+        Find users whose birthdays are within the next 7 days (including today),
+        or within the window of the given policy.
+
+        Returns:
+            Two parallel arrays: user indices ('L') and congratulation date ordinals ('l'),
+            in the order the users were added.
+        """
+        if today is None:
+            today = datetime.today().date()
+        window = {
+            month * 32 + day: congratulation_date.toordinal()
+            for (month, day), congratulation_date in congratulation_table(today, policy).items()
+        }
+        today_year = today.year
+        today_month_day = today.month * 32 + today.day
+
+        indices = array("L")
+        ordinals = array("l")
+        for index, (year, month_day) in enumerate(zip(self.years, self.month_days)):
+            ordinal = window.get(month_day)
+            if ordinal is None:
+                continue
+            # Skip users with future birth dates (not yet born)
+            if year > today_year or (year == today_year and month_day > today_month_day):
+                continue
+            indices.append(index)
+            ordinals.append(ordinal)
+        return indices, ordinals
+
+    def format_upcoming(self, indices: array, ordinals: array) -> list[dict[str, str]]:
+        """Turn the result of upcoming_indices into get_upcoming_birthdays dictionaries."""
+        return UpcomingColumns(indices, ordinals, self.names.__getitem__).to_dicts()
+
+    def get_upcoming_birthdays(self, today: datetime.date = None,
+                               policy: BirthdayPolicy = DEFAULT_POLICY) -> list[dict[str, str]]:
+        """Same result as get_upcoming_birthdays for the stored users."""
+        return self.format_upcoming(*self.upcoming_indices(today, policy))
+
+    def upcoming(self, today: datetime.date = None, policy: BirthdayPolicy = DEFAULT_POLICY) -> UpcomingColumns:
+        """The result of upcoming_indices as UpcomingColumns."""
+        return UpcomingColumns(*self.upcoming_indices(today, policy), self.names.__getitem__)
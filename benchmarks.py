@@ -0,0 +1,224 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable
+
+import instrumentation
+import Task3
+from Task1 import get_days_from_today, get_days_from_today_batch
+from Task2 import get_numbers_ticket, generate_tickets
+from Task3 import normalize_phone, normalize_phones
+from Task4 import get_upcoming_birthdays, get_upcoming_birthdays_columnar, BirthdayIndex
+
+# Dataset sizes every benchmark is run at, smallest first
+DATASET_SIZES = (1_000, 100_000, 1_000_000)
+# Allowed slowdown (and peak memory growth) against the baseline, in percent
+TOLERANCE = 10.0
+BASELINE_VERSION = 1
+
+def make_iso_dates(size: int, seed: int = 0) -> list[str]:
+    """Random 'YYYY-MM-DD' strings, about 1% of them invalid."""
+    rng = random.Random(seed)
+    start = datetime(1950, 1, 1)
+    dates = [(start + timedelta(days=rng.randrange(30_000))).strftime("%Y-%m-%d") for _ in range(size)]
+    for i in range(0, size, 100):
+        dates[i] = "not-a-date"
+    return dates
+
+def make_phones(size: int, seed: int = 0) -> list[str]:
+    """Random phone numbers in the formats from test_Task3.py."""
+    rng = random.Random(seed)
+    formats = ["067\t{} {}", "(095) {}-{}\n", "+380 44 {} {}", "38050{}{}", "    +38(050){}-{}", "{}{}"]
+    return [rng.choice(formats).format(rng.randrange(100, 1000), rng.randrange(1000, 10_000)) for _ in range(size)]
+
+def make_users(size: int, seed: int = 0) -> list[dict[str, str]]:
+    """Random users with birthdays between 1950 and 2009."""
+    rng = random.Random(seed)
+    start = datetime(1950, 1, 1)
+    return [
+        {"name": f"User {i}", "birthday": (start + timedelta(days=rng.randrange(21_900))).strftime("%Y.%m.%d")}
+        for i in range(size)
+    ]
+
+def _instrumented(func: Callable[[], object]) -> Callable[[], object]:
+    """Run func with instrumentation enabled."""
+    def run():
+        instrumentation.enable()
+        try:
+            return func()
+        finally:
+            instrumentation.disable()
+    return run
+
+def instrumentation_restores_originals() -> bool:
+    """Check that disabled instrumentation leaves the original functions in place (zero overhead)."""
+    original = Task3.normalize_phone
+    instrumentation.enable()
+    wrapped = Task3.normalize_phone
+    instrumentation.disable()
+    return wrapped is not original and Task3.normalize_phone is original
+
+def build_benchmarks(size: int) -> dict[str, Callable[[], object]]:
+    """Return benchmark name -> callable processing a dataset of size items."""
+    dates = make_iso_dates(size)
+    phones = make_phones(size)
+    users = make_users(size)
+    index = BirthdayIndex(users)
+    return {
+        "Task1.get_days_from_today": lambda: [get_days_from_today(d) for d in dates],
+        "Task1.get_days_from_today_batch": lambda: get_days_from_today_batch(dates),
+        "Task2.get_numbers_ticket": lambda: [get_numbers_ticket(1, 49, 6) for _ in range(size)],
+        "Task2.generate_tickets": lambda: generate_tickets(1, 49, 6, size, seed=1),
+        "Task3.normalize_phone": lambda: [normalize_phone(p) for p in phones],
+        "Task3.normalize_phones": lambda: normalize_phones(phones),
+        "Task3.normalize_phone[instrumentation off]": lambda: [Task3.normalize_phone(p) for p in phones],
+        "Task3.normalize_phone[instrumentation on]": _instrumented(lambda: [Task3.normalize_phone(p) for p in phones]),
+        "Task4.get_upcoming_birthdays": lambda: get_upcoming_birthdays(users),
+        "Task4.get_upcoming_birthdays_columnar": lambda: get_upcoming_birthdays_columnar(users),
+        "Task4.BirthdayIndex.get_upcoming_birthdays": lambda: index.get_upcoming_birthdays(),
+    }
+
+# Module -> upper bound of its cumulative import time in microseconds (python -X importtime)
+IMPORT_THRESHOLDS = {"tasks": 10_000, "Task1": 20_000, "Task2": 20_000, "Task3": 20_000, "Task4": 40_000}
+
+def measure_import_time(module: str) -> int:
+    """Import module in a fresh interpreter with -X importtime and return its cumulative time in microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in completed.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"no import time reported for {module!r}")
+
+def run_import_benchmarks(repeat: int = 5) -> list[tuple[str, float, float]]:
+    """Best cumulative import time of each module. Returns (name, microseconds, threshold)."""
+    return [
+        (f"import {module}", min(measure_import_time(module) for _ in range(repeat)), threshold)
+        for module, threshold in IMPORT_THRESHOLDS.items()
+    ]
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Run func once under tracemalloc and return the peak of traced memory in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmarks(sizes: tuple[int, ...] = DATASET_SIZES, repeat: int = 5,
+                   pattern: str = "") -> dict[str, dict[str, float]]:
+    """
+    Run every benchmark whose name contains pattern at each dataset size.
+
+    Returns:
+        dict: 'name[size]' -> us_per_item and items_per_second (best of repeat runs)
+              and peak_bytes (tracemalloc peak of one separate run, so tracing
+              does not slow down the timed runs).
+    """
+    results = {}
+    for size in sizes:
+        for name, func in build_benchmarks(size).items():
+            if pattern not in name:
+                continue
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            results[f"{name}[{size}]"] = {
+                "us_per_item": best / size * 1e6,
+                "items_per_second": size / best if best else float("inf"),
+                "peak_bytes": peak_memory(func),
+            }
+    return results
+
+def save_baseline(results: dict[str, dict[str, float]], path: str) -> None:
+    """Write results as a JSON baseline, with the interpreter they were measured on."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({
+            "version": BASELINE_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, file, indent=2)
+
+def load_baseline(path: str) -> dict[str, dict[str, float]]:
+    """Read the results of a baseline written by save_baseline."""
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path!r} is not a version {BASELINE_VERSION} benchmark baseline")
+    return baseline["results"]
+
+def compare_to_baseline(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]],
+                        tolerance: float = TOLERANCE) -> dict[str, list[str]]:
+    """
+    Compare results with a baseline.
+
+    Returns:
+        dict: benchmark name -> regressed metrics ('us_per_item', 'peak_bytes') that are
+              more than tolerance percent above the baseline. Benchmarks missing from
+              the baseline are not compared.
+    """
+    limit = 1 + tolerance / 100
+    regressions = {}
+    for name, measured in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        regressed = [metric for metric in ("us_per_item", "peak_bytes") if measured[metric] > expected[metric] * limit]
+        if regressed:
+            regressions[name] = regressed
+    return regressions
+
+def main(argv: list[str] | None = None) -> int:
+    """Print a benchmark report and return 1 if any benchmark is slower than the baseline allows."""
+    parser = argparse.ArgumentParser(description="Benchmark the Task modules.")
+    parser.add_argument("--size", type=int, action="append", dest="sizes",
+                        help=f"items per dataset, may be repeated (default: {', '.join(map(str, DATASET_SIZES))})")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark (best is kept)")
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--baseline", metavar="PATH", help="JSON baseline to compare against")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed slowdown and peak memory growth against the baseline, in percent")
+    parser.add_argument("--import-time", action="store_true", help="measure module import times instead")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        failed = False
+        print(f"{'module':<50}{'us':>10}{'limit':>10}")
+        for name, elapsed, threshold in run_import_benchmarks(args.repeat):
+            status = "ok" if elapsed <= threshold else "REGRESSION"
+            failed = failed or elapsed > threshold
+            print(f"{name:<50}{elapsed:>10.0f}{threshold:>10.0f}  {status}")
+        return 1 if failed else 0
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    results = run_benchmarks(tuple(args.sizes or DATASET_SIZES), args.repeat, args.pattern)
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+
+    print(f"{'benchmark':<60}{'us/item':>10}{'items/s':>14}{'peak KiB':>12}{'baseline':>10}")
+    for name, measured in results.items():
+        expected = baseline.get(name)
+        reference = f"{expected['us_per_item']:>10.3f}" if expected else f"{'-':>10}"
+        status = f"  REGRESSION ({', '.join(regressions[name])})" if name in regressions else ""
+        print(f"{name:<60}{measured['us_per_item']:>10.3f}{measured['items_per_second']:>14,.0f}"
+              f"{measured['peak_bytes'] / 1024:>12,.1f}{reference}{status}")
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+
+    failed = bool(regressions)
+    if not instrumentation_restores_originals():
+        print("instrumentation: disabled mode does not restore the original functions  REGRESSION")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+from datetime import date, datetime
+from functools import lru_cache
+
+# Default number of distinct (string, format) pairs kept by parse_date
+PARSE_CACHE_SIZE = 4096
+
+# Fixed-width formats that can be sliced into ints instead of going through strptime
+_FAST_FORMATS = {"%Y-%m-%d": "-", "%Y.%m.%d": "."}
+
+def _parse_date(value: str, fmt: str) -> date:
+    """Parse a date string, slicing fixed-width 'YYYY-MM-DD' / 'YYYY.MM.DD' strings directly."""
+    sep = _FAST_FORMATS.get(fmt)
+    # isascii: str.isdigit also accepts other scripts' digits, which strptime rejects
+    if sep is not None and len(value) == 10 and value.isascii() and value[4] == sep and value[7] == sep \
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit():
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return datetime.strptime(value, fmt).date()
+
+_cached_parse_date = lru_cache(maxsize=PARSE_CACHE_SIZE)(_parse_date)
+
+def parse_date(value: str, fmt: str = "%Y-%m-%d") -> date:
+    """
+    Parse a date string with a size-bounded LRU cache in front of the parser.
+
+    Args:
+        value (str): The date string.
+        fmt (str): strptime format. '%Y-%m-%d' and '%Y.%m.%d' use a fast path.
+
+    Returns:
+        date: The parsed date.
+
+    Raises:
+        ValueError: If the string does not match the format or is not a valid date.
+        TypeError: If the value is not a string.
+    """
+    return _cached_parse_date(value, fmt)
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """Replace the parse cache with an empty one holding at most maxsize entries."""
+    global _cached_parse_date
+    _cached_parse_date = lru_cache(maxsize=maxsize)(_parse_date)
+
+def parse_cache_info():
+    """Return the cache statistics (hits, misses, maxsize, currsize) of parse_date."""
+    return _cached_parse_date.cache_info()
+
+def clear_parse_cache() -> None:
+    """Drop all cached dates and reset the hit/miss counters."""
+    _cached_parse_date.cache_clear()
@@ -0,0 +1,387 @@
+import argparse
+import random
+import re
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+from typing import Any, NamedTuple
+
+import Task1
+import Task2
+import Task3
+import Task4
+
+# Reference implementations: the original per-item code every fast path must match.
+
+def reference_get_days_from_today(value: Any, today: date) -> int | str:
+    """Original Task1.get_days_from_today with an explicit today."""
+    try:
+        return (today - datetime.strptime(value, "%Y-%m-%d").date()).days
+    except (ValueError, TypeError):
+        return "Invalid date format"
+
+def reference_days_from(value: Any, today: date) -> int | str:
+    """Day delta of every input DaysCalculator accepts, computed without its converters."""
+    if isinstance(value, str) or value is None or isinstance(value, bool):
+        return reference_get_days_from_today(value, today)
+    if isinstance(value, datetime):
+        return (today - value.date()).days
+    if isinstance(value, date):
+        return (today - value).days
+    if isinstance(value, (int, float)):
+        try:
+            return (today - datetime.fromtimestamp(value).date()).days
+        except (OverflowError, OSError, ValueError):
+            return "Invalid date format"
+    return "Invalid date format"
+
+def reference_normalize_phone(phone_number: str) -> str:
+    """Original two-regex Task3.normalize_phone."""
+    has_valid_plus = bool(re.search(r'(^|[^\d+])\+', phone_number))
+    ints = ''.join(re.findall(r"\d+", phone_number))
+    if ints.startswith("00"):
+        return "+" + ints[2:]
+    if len(ints) < 9 or len(ints) > 12:
+        return ''
+    if has_valid_plus:
+        return '+' + ints
+    return '+380'[:(13 - len(ints))] + ints
+
+def reference_upcoming_birthdays(users: list[dict[str, str]], today: date) -> list[dict[str, str]]:
+    """Original Task4.get_upcoming_birthdays loop (per-user leap-year and weekend arithmetic)."""
+    result = []
+    for user in users:
+        birthday = datetime.strptime(user["birthday"], "%Y.%m.%d").date()
+        if birthday > today:
+            continue
+        birthday_this_year = Task4.get_birthday_this_year(birthday, today)
+        if birthday_this_year < today:
+            birthday_this_year = Task4.get_birthday_next_year(birthday, today)
+        if (birthday_this_year - today).days <= 7:
+            congratulation_date = Task4.adjust_weekend_date(birthday_this_year)
+            result.append({"name": user["name"], "congratulation_date": congratulation_date.strftime("%Y.%m.%d")})
+    return result
+
+def reference_ticket_is_valid(min: int, max: int, quantity: int) -> bool:
+    """Original get_numbers_ticket rules (plus quantity >= 1 from its docstring)."""
+    return not (quantity > max - min + 1 or min > max or min < 1 or quantity < 1 or max > 1000)
+
+# Random input generators, biased towards the edge cases of the Task functions.
+
+def random_today(rng: random.Random) -> date:
+    """A day between 2020 and 2039, often close to February 28th / 29th or New Year."""
+    year = rng.randrange(2020, 2040)
+    kind = rng.random()
+    if kind < 0.3:
+        return date(year, 2, 20) + timedelta(days=rng.randrange(12))
+    if kind < 0.4:
+        return date(year, 12, 24) + timedelta(days=rng.randrange(8))
+    return date(year, 1, 1) + timedelta(days=rng.randrange(365))
+
+def random_users(rng: random.Random, today: date, size: int = 20) -> list[dict[str, str]]:
+    """Users born around today's month/day, on February 28th / 29th, or after today."""
+    users = []
+    for number in range(size):
+        kind = rng.random()
+        if kind < 0.2:
+            birthday = date(rng.choice([1992, 1996, 2000, 2004]), 2, 29)
+        elif kind < 0.3:
+            birthday = date(rng.randrange(1950, 2010), rng.choice([2, 3]), rng.choice([1, 28]))
+        elif kind < 0.35:
+            birthday = today + timedelta(days=rng.randrange(0, 30))
+        else:
+            day = today + timedelta(days=rng.randrange(-3, 12))
+            year = rng.randrange(1950, today.year + 1)
+            birthday = day.replace(year=year) if not (day.month == 2 and day.day == 29) else date(year, 3, 1)
+        users.append({"name": f"User {number}", "birthday": birthday.strftime("%Y.%m.%d")})
+    return users
+
+def random_iso_date(rng: random.Random) -> Any:
+    """Valid and invalid 'YYYY-MM-DD' inputs, including non-strings."""
+    kind = rng.random()
+    if kind < 0.6:
+        return (date(1800, 1, 1) + timedelta(days=rng.randrange(120_000))).isoformat()
+    if kind < 0.7:
+        return f"{rng.randrange(1900, 2100)}-{rng.randrange(0, 14)}-{rng.randrange(0, 33)}"
+    if kind < 0.8:
+        return f"{rng.randrange(1900, 2100)}-{rng.randrange(1, 13):02d}-{rng.randrange(28, 33):02d}"
+    return rng.choice(["", " 2020-01-01 ", "2020/01/01", "01-01-2020", "2020-01-0a", None, 12345, "٢٠٢٠-٠١-٠١"])
+
+def random_days_input(rng: random.Random) -> Any:
+    """Any input DaysCalculator takes: strings, dates, datetimes, timestamps and invalid values."""
+    kind = rng.random()
+    if kind < 0.5:
+        return random_iso_date(rng)
+    day = date(1950, 1, 1) + timedelta(days=rng.randrange(40_000))
+    if kind < 0.65:
+        return day
+    if kind < 0.8:
+        return datetime(day.year, day.month, day.day, rng.randrange(24), rng.randrange(60))
+    if kind < 0.95:
+        timestamp = datetime(day.year, day.month, day.day, rng.randrange(24)).timestamp()
+        return int(timestamp) if rng.random() < 0.5 else timestamp + rng.random()
+    return rng.choice([True, None, [], 10 ** 20, float("nan")])
+
+def random_ua_phone(rng: random.Random) -> str:
+    """Ukrainian numbers in the national, '380' and '+380' forms, with separators."""
+    number = rng.choice(["50", "63", "66", "67", "68", "73", "93", "95", "97", "44", "32"]) + \
+        "".join(rng.choice("0123456789") for _ in range(7))
+    prefix = rng.choice(["", "0", "380", "+380", "+38 0", "38(0", "00380"])
+    separator = rng.choice(["", " ", "-", "\t"])
+    return " " * rng.randrange(3) + prefix + separator.join([number[:2], number[2:5], number[5:7], number[7:]])
+
+def random_phone(rng: random.Random) -> str:
+    """Phone-like strings mixing digits, plus signs, separators and letters."""
+    kind = rng.random()
+    if kind < 0.5:
+        alphabet = "0123456789+ -()\t"
+        return "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 20)))
+    prefix = rng.choice(["", "+", "00", "+38", "38", "0", "++", " +", "a+", "+0"])
+    separators = rng.choice(["", " ", "-", "()"])
+    digits = "".join(rng.choice("0123456789") for _ in range(rng.randrange(5, 14)))
+    return prefix + separators.join(digits[i:i + 3] for i in range(0, len(digits), 3))
+
+# Shrinking and comparison.
+
+class Mismatch(NamedTuple):
+    """A (shrunk) input on which the candidate differs from the reference."""
+    name: str
+    case: tuple
+    expected: Any
+    actual: Any
+
+def _smaller(value: Any) -> Iterator[Any]:
+    """Yield simpler versions of one argument: halves first, then single elements removed."""
+    if isinstance(value, (str, list)) and value:
+        half = len(value) // 2
+        if half:
+            yield value[:half]
+            yield value[half:]
+        for i in range(len(value)):
+            yield value[:i] + value[i + 1:]
+
+def shrink(case: tuple, fails: Callable[[tuple], bool]) -> tuple:
+    """Greedily simplify the arguments of a failing case while it keeps failing."""
+    improved = True
+    while improved:
+        improved = False
+        for position, value in enumerate(case):
+            for smaller in _smaller(value):
+                candidate = case[:position] + (smaller,) + case[position + 1:]
+                if fails(candidate):
+                    case = candidate
+                    improved = True
+                    break
+            if improved:
+                break
+    return case
+
+# Cases of an ordinary check per case of a check that starts worker processes
+PROCESS_POOL_COST = 50
+
+class Check(NamedTuple):
+    """
+    A candidate, its reference, an input generator and how to compare results.
+    A check with cost n runs one case for every n requested cases (at least one).
+    """
+    reference: Callable
+    candidate: Callable
+    generate: Callable[[random.Random], tuple]
+    normalize: Callable[[Any], Any] = lambda result: result
+    cost: int = 1
+
+def _sorted_by_name(result: list[dict[str, str]]) -> list[dict[str, str]]:
+    return sorted(result, key=lambda item: (item["name"], item["congratulation_date"]))
+
+def _upcoming_case(rng: random.Random) -> tuple:
+    today = random_today(rng)
+    return random_users(rng, today), today
+
+def _tracker_results(users: list[dict[str, str]], today: date) -> list[dict[str, str]]:
+    """Build a tracker a few days early and advance it, so the incremental path is exercised."""
+    tracker = Task4.UpcomingBirthdaysTracker(users, today - timedelta(days=3))
+    tracker.advance(today - timedelta(days=1))
+    tracker.advance(today)
+    return tracker.results()
+
+def _snapshot_results(users: list[dict[str, str]], today: date) -> list[dict[str, str]]:
+    import snapshot
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "users.bday")
+        snapshot.write_snapshot(users, path)
+        with snapshot.BirthdaySnapshot(path) as users_snapshot:
+            return users_snapshot.get_upcoming_birthdays(today)
+
+def _ticket_case(rng: random.Random) -> tuple:
+    low = rng.randrange(-2, 1003)
+    high = rng.randrange(-2, 1003)
+    # Small batches draw ticket by ticket, larger ones in bulk
+    count = rng.choice((0, 1, 2, 3, Task2.BULK_MIN_COUNT + 20))
+    return low, high, rng.randrange(-1, 12), count, rng.randrange(1000)
+
+def _ticket_properties(min: int, max: int, quantity: int, count: int, seed: int) -> tuple:
+    """What every generate_tickets result must look like, computed from the reference rules."""
+    if count < 1 or not reference_ticket_is_valid(min, max, quantity):
+        return 0, True
+    return count * quantity, True
+
+def _ticket_observed(min: int, max: int, quantity: int, count: int, seed: int) -> tuple:
+    tickets = Task2.generate_tickets(min, max, quantity, count, seed)
+    rows = [list(tickets[i:i + quantity]) for i in range(0, len(tickets), quantity)] if tickets else []
+    rows_ok = all(row == sorted(set(row)) and all(min <= x <= max for x in row) for row in rows)
+    return len(tickets), rows_ok
+
+def _numbers_ticket_observed(min: int, max: int, quantity: int) -> tuple:
+    ticket = Task2.get_numbers_ticket(min, max, quantity)
+    return len(ticket), ticket == sorted(set(ticket)) and all(min <= x <= max for x in ticket)
+
+def _replay_case(rng: random.Random) -> tuple:
+    shapes = [(1, 49, 6), (1, 1000, 10), (5, 20, 3), (1, 6, 6), (0, 10, 3)]
+    return rng.randrange(2 ** 64), [rng.choice(shapes) for _ in range(rng.randrange(1, 30))]
+
+def _recorded_tickets(seed: int, shapes: list[tuple]) -> list[list[int]]:
+    service = Task2.TicketService(seed)
+    for shape in shapes:
+        service.issue(*shape)
+    return [record.numbers for record in service.records]
+
+def _replayed_tickets(seed: int, shapes: list[tuple]) -> list[list[int]]:
+    service = Task2.TicketService(seed)
+    for shape in shapes:
+        service.issue(*shape)
+    return [service.replay(record) for record in reversed(service.records)][::-1]
+
+def _parallel_case(rng: random.Random) -> tuple:
+    return (random_users(rng, datetime.today().date(), size=40),)
+
+CHECKS: dict[str, Check] = {
+    "Task1.get_days_from_today": Check(
+        lambda value: reference_get_days_from_today(value, datetime.today().date()),
+        Task1.get_days_from_today,
+        lambda rng: (random_iso_date(rng),),
+    ),
+    "Task1.get_days_from_today_batch": Check(
+        lambda values: [reference_get_days_from_today(v, datetime.today().date()) for v in values],
+        lambda values: [delta if ok else "Invalid date format" for delta, ok in zip(*Task1.get_days_from_today_batch(values))],
+        lambda rng: ([random_iso_date(rng) for _ in range(10)],),
+    ),
+    "Task1.DaysCalculator": Check(
+        lambda values, today: [reference_days_from(v, today) for v in values],
+        lambda values, today: Task1.DaysCalculator(clock=lambda: today).days_from_many(values),
+        lambda rng: ([random_days_input(rng) for _ in range(10)], random_today(rng)),
+    ),
+    "Task2.get_numbers_ticket": Check(
+        lambda min, max, quantity: (quantity if reference_ticket_is_valid(min, max, quantity) else 0, True),
+        _numbers_ticket_observed,
+        lambda rng: _ticket_case(rng)[:3],
+    ),
+    "Task2.TicketService.replay": Check(_recorded_tickets, _replayed_tickets, _replay_case),
+    "Task3.normalize_phone": Check(reference_normalize_phone, Task3.normalize_phone, lambda rng: (random_phone(rng),)),
+    "Task3.normalize_phones": Check(
+        lambda phones: [reference_normalize_phone(p) for p in phones],
+        Task3.normalize_phones,
+        lambda rng: ([random_phone(rng) for _ in range(10)],),
+    ),
+    "Task3.classify_phone": Check(
+        lambda phone: ("UA", reference_normalize_phone(phone)),
+        Task3.classify_phone,
+        lambda rng: (random_ua_phone(rng),),
+    ),
+    "Task3.validate_phones": Check(
+        lambda phones: [reference_normalize_phone(p) != '' for p in phones],
+        lambda phones: [status < Task3.PHONE_EMPTY for status in Task3.validate_phones(phones)[0]],
+        lambda rng: ([random_phone(rng) for _ in range(10)],),
+    ),
+    "Task4.iter_upcoming_birthdays": Check(
+        reference_upcoming_birthdays,
+        lambda users, today: list(Task4.iter_upcoming_birthdays(users, today)),
+        _upcoming_case,
+    ),
+    "Task4.BirthdayIndex": Check(
+        reference_upcoming_birthdays,
+        lambda users, today: Task4.BirthdayIndex(users).get_upcoming_birthdays(today),
+        _upcoming_case,
+        _sorted_by_name,
+    ),
+    "Task4.UserStore": Check(
+        reference_upcoming_birthdays,
+        lambda users, today: Task4.UserStore(users).get_upcoming_birthdays(today),
+        _upcoming_case,
+    ),
+    "Task4.get_upcoming_birthdays_columnar": Check(
+        reference_upcoming_birthdays,
+        lambda users, today: Task4.get_upcoming_birthdays_columnar(users, today).to_dicts(),
+        _upcoming_case,
+    ),
+    # Every case starts a process pool, so this check runs one case in PROCESS_POOL_COST
+    "Task4.get_upcoming_birthdays[workers=2]": Check(
+        lambda users: reference_upcoming_birthdays(users, datetime.today().date()),
+        lambda users: Task4.get_upcoming_birthdays(users, workers=2, parallel_threshold=0),
+        _parallel_case,
+        cost=PROCESS_POOL_COST,
+    ),
+    "Task4.UpcomingBirthdaysTracker": Check(reference_upcoming_birthdays, _tracker_results, _upcoming_case, _sorted_by_name),
+    "snapshot.BirthdaySnapshot": Check(reference_upcoming_birthdays, _snapshot_results, _upcoming_case),
+    "Task2.generate_tickets": Check(_ticket_properties, _ticket_observed, _ticket_case),
+}
+
+def run_check(name: str, check: Check, cases: int, seed: int = 0) -> tuple[Mismatch | None, float, float]:
+    """
+    Run cases random inputs through the reference and the candidate.
+
+    Returns:
+        The first mismatch (shrunk), or None, and the total seconds spent in the
+        reference and in the candidate.
+    """
+    rng = random.Random(seed)
+    reference_seconds = candidate_seconds = 0.0
+
+    def outcome(func: Callable, case: tuple) -> Any:
+        try:
+            return check.normalize(func(*case))
+        except Exception as error:
+            return f"raised {type(error).__name__}"
+
+    def fails(case: tuple) -> bool:
+        return outcome(check.reference, case) != outcome(check.candidate, case)
+
+    for _ in range(max(1, cases // check.cost)):
+        case = check.generate(rng)
+        started = time.perf_counter()
+        expected = outcome(check.reference, case)
+        middle = time.perf_counter()
+        actual = outcome(check.candidate, case)
+        candidate_seconds += time.perf_counter() - middle
+        reference_seconds += middle - started
+        if expected != actual:
+            case = shrink(case, fails)
+            return Mismatch(name, case, outcome(check.reference, case), outcome(check.candidate, case)), \
+                reference_seconds, candidate_seconds
+    return None, reference_seconds, candidate_seconds
+
+def main(argv: list[str] | None = None) -> int:
+    """Run every check, print reference/candidate timings, and return 1 on any mismatch."""
+    parser = argparse.ArgumentParser(description="Differential tests of the fast paths against the reference code.")
+    parser.add_argument("--cases", type=int, default=10_000, help="random cases per check")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-k", dest="pattern", default="", help="only run checks containing this text")
+    args = parser.parse_args(argv)
+
+    failed = False
+    print(f"{'check':<40}{'reference s':>12}{'candidate s':>12}{'speedup':>9}")
+    for name, check in CHECKS.items():
+        if args.pattern not in name:
+            continue
+        mismatch, reference_seconds, candidate_seconds = run_check(name, check, args.cases, args.seed)
+        speedup = reference_seconds / candidate_seconds if candidate_seconds else float("inf")
+        print(f"{name:<40}{reference_seconds:>12.3f}{candidate_seconds:>12.3f}{speedup:>8.2f}x")
+        if mismatch is not None:
+            failed = True
+            print(f"  MISMATCH on {mismatch.case!r}\n    expected {mismatch.expected!r}\n    actual   {mismatch.actual!r}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import importlib
+import json
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable
+
+# Upper bounds of the latency histogram buckets, in seconds (the last bucket is +Inf)
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 0.1, 1.0)
+
+def _single_item(args: tuple, kwargs: dict) -> int:
+    return 1
+
+def _users_count(args: tuple, kwargs: dict) -> int:
+    users = args[0] if args else kwargs.get("users", ())
+    # Generators have no length; they are counted as calls only
+    return len(users) if hasattr(users, "__len__") else 0
+
+# module, function, batch size of a call, whether a result means invalid input
+# (a call that raises always counts as invalid input)
+INSTRUMENTED_FUNCTIONS: tuple[tuple[str, str, Callable[[tuple, dict], int], Callable[[Any], bool]], ...] = (
+    ("Task1", "get_days_from_today", _single_item, lambda result: isinstance(result, str)),
+    ("Task2", "get_numbers_ticket", _single_item, lambda result: result == []),
+    ("Task3", "normalize_phone", _single_item, lambda result: result == ''),
+    ("Task4", "get_upcoming_birthdays", _users_count, lambda result: False),
+)
+
+class _FunctionStats:
+    """Counters of one function in one thread. Only that thread writes to them."""
+
+    __slots__ = ("calls", "invalid", "items", "latency_sum", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.invalid = 0
+        self.items = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def merge(self, other: "_FunctionStats") -> None:
+        """Add the counters of other to this one."""
+        self.calls += other.calls
+        self.invalid += other.invalid
+        self.items += other.items
+        self.latency_sum += other.latency_sum
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+class _ThreadToken:
+    """Kept only in a thread's local storage, so it is freed when the thread ends."""
+    __slots__ = ("__weakref__",)
+
+_local = threading.local()
+_registry_lock = threading.Lock()
+# Counters of live threads, by id of the counters dict
+_thread_stats: dict[int, dict[str, _FunctionStats]] = {}
+# Counters folded in from threads that have ended
+_retired: dict[str, _FunctionStats] = {}
+_originals: dict[tuple[str, str], Callable] = {}
+
+def _retire(stats: dict[str, _FunctionStats]) -> None:
+    """Fold the counters of an ended thread into _retired, so thread churn does not grow the registry."""
+    with _registry_lock:
+        _thread_stats.pop(id(stats), None)
+        for name, function_stats in stats.items():
+            _retired.setdefault(name, _FunctionStats()).merge(function_stats)
+
+def _stats_for(name: str) -> _FunctionStats:
+    """Return this thread's counters for name, registering the thread on first use."""
+    stats = getattr(_local, "stats", None)
+    if stats is None:
+        stats = _local.stats = {}
+        _local.token = token = _ThreadToken()
+        weakref.finalize(token, _retire, stats)
+        with _registry_lock:
+            _thread_stats[id(stats)] = stats
+    function_stats = stats.get(name)
+    if function_stats is None:
+        function_stats = stats[name] = _FunctionStats()
+    return function_stats
+
+def _instrument(name: str, func: Callable, batch_size: Callable, is_invalid: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        raised = True
+        try:
+            result = func(*args, **kwargs)
+            raised = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            stats = _stats_for(name)
+            stats.calls += 1
+            stats.items += batch_size(args, kwargs)
+            stats.latency_sum += elapsed
+            stats.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+            if raised or is_invalid(result):
+                stats.invalid += 1
+    return wrapper
+
+def enable() -> None:
+    """
+    Replace the Task functions with counting wrappers.
+
+    Only calls made through the module attribute (e.g. Task3.normalize_phone) are counted;
+    names imported with 'from Task3 import normalize_phone' before enable() keep the original.
+    """
+    for module_name, name, batch_size, is_invalid in INSTRUMENTED_FUNCTIONS:
+        if (module_name, name) in _originals:
+            continue
+        module = importlib.import_module(module_name)
+        original = getattr(module, name)
+        _originals[module_name, name] = original
+        setattr(module, name, _instrument(name, original, batch_size, is_invalid))
+
+def disable() -> None:
+    """Put the original functions back, so disabled instrumentation costs nothing."""
+    for (module_name, name), original in list(_originals.items()):
+        setattr(importlib.import_module(module_name), name, original)
+        del _originals[module_name, name]
+
+def is_enabled() -> bool:
+    """Return True while the wrappers are installed."""
+    return bool(_originals)
+
+def reset() -> None:
+    """Drop all collected counters."""
+    with _registry_lock:
+        for stats in _thread_stats.values():
+            stats.clear()
+        _retired.clear()
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """
+    Sum the counters of all threads.
+
+    Returns:
+        dict: function name -> calls, invalid, items, latency_sum and the cumulative
+              latency histogram as a list of [upper bound, count] pairs.
+    """
+    totals: dict[str, _FunctionStats] = {}
+    with _registry_lock:
+        for stats in [_retired, *_thread_stats.values()]:
+            for name, function_stats in list(stats.items()):
+                totals.setdefault(name, _FunctionStats()).merge(function_stats)
+
+    result = {}
+    for name, total in totals.items():
+        cumulative = 0
+        histogram = []
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), total.buckets):
+            cumulative += count
+            histogram.append([bound, cumulative])
+        result[name] = {
+            "calls": total.calls,
+            "invalid": total.invalid,
+            "items": total.items,
+            "latency_sum": total.latency_sum,
+            "latency_histogram": histogram,
+        }
+    return result
+
+def export_json() -> str:
+    """Return the snapshot as JSON (the +Inf bucket bound is written as null)."""
+    data = snapshot()
+    for stats in data.values():
+        stats["latency_histogram"] = [[None if bound == float("inf") else bound, count]
+                                      for bound, count in stats["latency_histogram"]]
+    return json.dumps(data)
+
+def export_prometheus() -> str:
+    """Return the snapshot in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = []
+    counters = (
+        ("task_calls_total", "Number of calls.", "calls"),
+        ("task_invalid_total", "Number of calls rejected as invalid input.", "invalid"),
+        ("task_items_total", "Number of items processed (batch sizes summed).", "items"),
+    )
+    for metric, help_text, key in counters:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} counter")
+        for name, stats in data.items():
+            lines.append(f'{metric}{{function="{name}"}} {stats[key]}')
+    lines.append("# HELP task_latency_seconds Call latency.")
+    lines.append("# TYPE task_latency_seconds histogram")
+    for name, stats in data.items():
+        for bound, count in stats["latency_histogram"]:
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'task_latency_seconds_bucket{{function="{name}",le="{le}"}} {count}')
+        lines.append(f'task_latency_seconds_sum{{function="{name}"}} {stats["latency_sum"]}')
+        lines.append(f'task_latency_seconds_count{{function="{name}"}} {stats["calls"]}')
+    return "\n".join(lines) + "\n"
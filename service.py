@@ -0,0 +1,322 @@
+import argparse
+import asyncio
+import copy
+import json
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable
+
+from Task3 import normalize_phones
+from Task4 import iter_upcoming_birthdays
+
+# Longest time a request waits for other requests to join its batch, in seconds
+BATCH_DELAY = 0.002
+# Largest number of requests handled by one batch call
+MAX_BATCH = 1024
+# Requests that may wait for a batch before new ones are held back
+QUEUE_SIZE = 10_000
+# Number of recent latencies kept for the percentile report
+LATENCY_WINDOW = 100_000
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the value at the given fraction (0..1) of the sorted values, or 0.0 if empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class MicroBatcher:
+    """
+    Collect concurrent requests for a short time and handle them with one call.
+
+    func receives the list of queued items and must return a list of results in the
+    same order; an exception instance in that list is raised to that caller only.
+    The queue is bounded: when it is full, submit waits, which slows clients down
+    instead of letting memory grow. Requests still waiting when the batcher stops
+    fail with asyncio.CancelledError.
+    """
+
+    def __init__(self, func: Callable[[list], list], max_batch: int = MAX_BATCH,
+                 delay: float = BATCH_DELAY, queue_size: int = QUEUE_SIZE):
+        self.func = func
+        self.max_batch = max_batch
+        self.delay = delay
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.batches = 0
+        self._task: asyncio.Task | None = None
+        self._stopped = False
+
+    def start(self) -> None:
+        """Start the background batching task."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background batching task and fail the requests still queued."""
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._cancel_queued()
+
+    def _cancel_queued(self) -> None:
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            future.cancel()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result."""
+        if self._stopped:
+            raise asyncio.CancelledError("batcher is stopped")
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((item, future))
+        # stop() may have run while this request waited for room in the queue
+        if self._stopped:
+            self._cancel_queued()
+        return await future
+
+    async def _get(self, timeout: float) -> tuple | None:
+        """
+        The next queued (item, future), or None after timeout seconds. asyncio.wait_for
+        is not used: before Python 3.12 it swallows a cancellation that arrives just as
+        the queue hands over an item, and stop() would then wait for _run forever.
+        """
+        getter = asyncio.ensure_future(self.queue.get())
+        try:
+            await asyncio.wait((getter,), timeout=timeout)
+        except asyncio.CancelledError:
+            getter.cancel()
+            if getter.done() and not getter.cancelled():
+                # The item was already taken off the queue, so nobody else will cancel it
+                getter.result()[1].cancel()
+            raise
+        if not getter.done():
+            # Queue.get puts nothing back on cancellation because it has not taken anything yet
+            getter.cancel()
+            return None
+        return getter.result()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.delay
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    entry = await self._get(timeout)
+                    if entry is None:
+                        break
+                    batch.append(entry)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            self.batches += 1
+            results, error = _call_batch(self.func, [item for item, _ in batch])
+            if error is not None:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(_own_exception(error))
+                continue
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+def _call_batch(func: Callable[[list], list], items: list) -> tuple[list | None, Exception | None]:
+    """
+    Call func outside the batching coroutine. An exception caught here has no frame of
+    MicroBatcher._run in its traceback, so a caller clearing the traceback frames
+    (as unittest's assertRaises does) cannot close the batching loop.
+    """
+    try:
+        return func(items), None
+    except Exception as error:
+        return None, error
+
+def _own_exception(error: Exception) -> Exception:
+    """
+    A copy of error for one caller, so the tracebacks that different callers add
+    while re-raising it never end up in one shared exception object.
+    """
+    try:
+        clone = copy.copy(error)
+    except Exception:
+        return error
+    clone.__cause__ = error.__cause__
+    clone.__context__ = error.__context__
+    clone.__suppress_context__ = error.__suppress_context__
+    return clone.with_traceback(error.__traceback__)
+
+def _upcoming_birthdays_batch(requests: list[list[dict[str, str]]]) -> list[list[dict[str, str]]]:
+    """Answer several get_upcoming_birthdays requests with one shared today."""
+    today = datetime.today().date()
+    results = []
+    for users in requests:
+        # A malformed user list fails only its own request, not the whole batch
+        try:
+            results.append(list(iter_upcoming_birthdays(users, today)))
+        except (ValueError, KeyError, TypeError) as error:
+            results.append(error)
+    return results
+
+class TaskService:
+    """
+    Line-protocol server for normalize_phone and get_upcoming_birthdays.
+
+    Every request is one JSON line, every response is one JSON line:
+        {"op": "normalize_phone", "phone": "067 123 4567"} -> {"result": "+380671234567"}
+        {"op": "get_upcoming_birthdays", "users": [...]}   -> {"result": [...]}
+        {"op": "stats"}                                     -> {"result": {"count": ..., "p50_ms": ..., ...}}
+    Errors are returned as {"error": "..."}.
+    """
+
+    def __init__(self, delay: float = BATCH_DELAY, max_batch: int = MAX_BATCH, queue_size: int = QUEUE_SIZE):
+        self.phones = MicroBatcher(normalize_phones, max_batch, delay, queue_size)
+        self.birthdays = MicroBatcher(_upcoming_birthdays_batch, max_batch, delay, queue_size)
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """Start listening and return the bound (host, port)."""
+        self.phones.start()
+        self.birthdays.start()
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self) -> None:
+        """Stop listening and cancel the batchers."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        await self.phones.stop()
+        await self.birthdays.stop()
+
+    def stats(self) -> dict[str, float]:
+        """Request count and p50/p99 latency in milliseconds over the recent window."""
+        latencies = list(self.latencies)
+        return {
+            "count": len(latencies),
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "phone_batches": self.phones.batches,
+            "birthday_batches": self.birthdays.batches,
+        }
+
+    async def handle_request(self, request: dict) -> dict:
+        """Answer one decoded request."""
+        op = request.get("op")
+        if op == "normalize_phone":
+            phone = request.get("phone")
+            if not isinstance(phone, str):
+                return {"error": "'phone' must be a string"}
+            return {"result": await self.phones.submit(phone)}
+        if op == "get_upcoming_birthdays":
+            users = request.get("users")
+            if not isinstance(users, list):
+                return {"error": "'users' must be a list"}
+            return {"result": await self.birthdays.submit(users)}
+        if op == "stats":
+            return {"result": self.stats()}
+        return {"error": f"unknown op: {op!r}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                started = time.perf_counter()
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    response = {"error": str(error)}
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+                self.latencies.append(time.perf_counter() - started)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+async def run_load(host: str, port: int, connections: int = 50, requests: int = 200) -> dict[str, float]:
+    """
+    Load generator: open several connections and send normalize_phone requests
+    one after another on each. Returns throughput and client-side p50/p99 latency.
+    """
+    latencies: list[float] = []
+
+    async def client(number: int) -> None:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in range(requests):
+                started = time.perf_counter()
+                request = {"op": "normalize_phone", "phone": f"(050) {number % 1000:03d}-{i % 10_000:04d}"}
+                writer.write(json.dumps(request).encode() + b"\n")
+                await writer.drain()
+                await reader.readline()
+                latencies.append(time.perf_counter() - started)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(number) for number in range(connections)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+async def _serve(host: str, port: int) -> None:
+    service = TaskService()
+    host, port = await service.start(host, port)
+    print(f"Listening on {host}:{port}")
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.stop()
+
+async def _serve_and_load(connections: int, requests: int) -> dict[str, float]:
+    service = TaskService()
+    host, port = await service.start()
+    try:
+        report = await run_load(host, port, connections, requests)
+        report["server"] = service.stats()
+        return report
+    finally:
+        await service.stop()
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the server, or a load test against a server (a local one if no port is given)."""
+    parser = argparse.ArgumentParser(description="Line-protocol server for the Task functions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    load = commands.add_parser("load", help="run the load generator")
+    load.add_argument("--host", default="127.0.0.1")
+    load.add_argument("--port", type=int, help="server port (default: start a local server)")
+    load.add_argument("--connections", type=int, default=50)
+    load.add_argument("--requests", type=int, default=200, help="requests per connection")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        asyncio.run(_serve(args.host, args.port))
+    elif args.port is None:
+        print(json.dumps(asyncio.run(_serve_and_load(args.connections, args.requests)), indent=2))
+    else:
+        print(json.dumps(asyncio.run(run_load(args.host, args.port, args.connections, args.requests)), indent=2))
+
+if __name__ == '__main__':
+    main()
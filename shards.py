@@ -0,0 +1,433 @@
+import argparse
+import heapq
+import json
+import os
+import shutil
+import socket
+import threading
+from array import array
+from datetime import date, datetime
+from multiprocessing import AuthenticationError, Pipe, Process
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Dict, Iterable, List
+
+from snapshot import HEADER, MAGIC, RECORD, VERSION as SNAPSHOT_VERSION, BirthdaySnapshot
+from Task4 import DEFAULT_POLICY, BirthdayPolicy, congratulation_table, format_dates, parse_birthday
+
+# Directory layout:
+#   manifest.json        {"version": 1, "shards": n, "count": users}
+#   shard-NNN.bday       users of one day-of-year range, in the snapshot.py format
+#   shard-NNN.idx        array('Q') of their positions in the original user list
+MANIFEST = "manifest.json"
+VERSION = 1
+DEFAULT_SHARDS = 12
+# Bytes of records, names and positions write_shards buffers per shard before appending them to disk
+SPOOL_BUFFER_SIZE = 1 << 16
+
+# Day of the year (0-365) of every (month, day), counted in a leap year so February 29th has its own day
+_DAY_OF_YEAR = {(day.month, day.day): index for index, day in
+                enumerate(date.fromordinal(ordinal) for ordinal in range(date(2000, 1, 1).toordinal(), date(2001, 1, 1).toordinal()))}
+
+def shard_of(month: int, day: int, shards: int) -> int:
+    """Return the shard holding birthdays on month/day when the year is split into shards ranges."""
+    return _DAY_OF_YEAR[month, day] * shards // 366
+
+def shards_for_window(today: datetime.date, shards: int, policy: BirthdayPolicy = DEFAULT_POLICY) -> list[int]:
+    """Return the sorted shard numbers whose birthdays can fall inside the policy's window."""
+    return sorted({shard_of(month, day, shards) for month, day in congratulation_table(today, policy)})
+
+def _shard_path(directory: str, shard: int, suffix: str) -> str:
+    return os.path.join(directory, f"shard-{shard:03d}.{suffix}")
+
+class _ShardSpool:
+    """
+    One shard being written by write_shards. Records, names and positions are buffered
+    and appended to temporary files, so only SPOOL_BUFFER_SIZE bytes per shard are held
+    in memory; finish joins them into the shard files.
+    """
+
+    def __init__(self, directory: str, shard: int):
+        self.bday_path = _shard_path(directory, shard, "bday")
+        self.idx_path = _shard_path(directory, shard, "idx")
+        self.temp_paths = (self.bday_path + ".records.tmp", self.bday_path + ".names.tmp", self.idx_path + ".tmp")
+        for path in self.temp_paths:
+            open(path, "wb").close()
+        self.buffers = (bytearray(), bytearray(), array("Q"))
+        self.count = 0
+        self.names_size = 0
+
+    def add(self, position: int, birthday: datetime.date, name: bytes) -> None:
+        records, names, positions = self.buffers
+        records += RECORD.pack(birthday.year, birthday.month, birthday.day, self.names_size, len(name))
+        names += name
+        positions.append(position)
+        self.count += 1
+        self.names_size += len(name)
+        if len(records) + len(names) + positions.itemsize * len(positions) >= SPOOL_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        for path, buffer in zip(self.temp_paths, self.buffers):
+            if buffer:
+                with open(path, "ab") as file:
+                    file.write(buffer)
+                del buffer[:]
+
+    def finish(self) -> None:
+        """Write the shard files in the snapshot.py format and drop the temporary files."""
+        self.flush()
+        records_path, names_path, idx_temp_path = self.temp_paths
+        with open(self.bday_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, SNAPSHOT_VERSION, self.count, HEADER.size + self.count * RECORD.size))
+            for path in (records_path, names_path):
+                with open(path, "rb") as part:
+                    shutil.copyfileobj(part, file)
+                os.remove(path)
+        os.replace(idx_temp_path, self.idx_path)
+
+    def discard(self) -> None:
+        for path in self.temp_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+def write_shards(users: Iterable[Dict[str, str]], directory: str, shards: int = DEFAULT_SHARDS) -> int:
+    """
+    Partition users in the get_upcoming_birthdays format by day of the year of their
+    birthday and write one snapshot file per shard. Returns the number of users written.
+
+    Users are streamed into per-shard temporary files, so the input can be larger than
+    memory; the shard files are only replaced once every user has been read.
+    """
+    if not 1 <= shards <= 366:
+        raise ValueError("shards must be between 1 and 366")
+    os.makedirs(directory, exist_ok=True)
+    manifest = os.path.join(directory, MANIFEST)
+    spools = [_ShardSpool(directory, shard) for shard in range(shards)]
+    count = 0
+    try:
+        for position, user in enumerate(users):
+            birthday = parse_birthday(user["birthday"])
+            spools[shard_of(birthday.month, birthday.day, shards)].add(position, birthday, user["name"].encode("utf-8"))
+            count += 1
+        # Drop the old manifest first, so a half-replaced directory is never picked up
+        if os.path.exists(manifest):
+            os.remove(manifest)
+        for spool in spools:
+            spool.finish()
+    finally:
+        for spool in spools:
+            spool.discard()
+    # The manifest is written last
+    with open(manifest, "w", encoding="utf-8") as file:
+        json.dump({"version": VERSION, "shards": shards, "count": count}, file)
+    return count
+
+class ShardReader:
+    """The shards of one directory, opened on first use and answered from the memory maps."""
+
+    def __init__(self, directory: str, shards: Iterable[int] | None = None):
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("version") != VERSION:
+            raise ValueError(f"{directory!r} is not a version {VERSION} shard directory")
+        self.directory = directory
+        self.shards = manifest["shards"]
+        self.available = sorted(range(self.shards) if shards is None else set(shards) & set(range(self.shards)))
+        self._open: dict[int, tuple[BirthdaySnapshot, array]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, shard: int) -> tuple[BirthdaySnapshot, array]:
+        with self._lock:
+            opened = self._open.get(shard)
+            if opened is None:
+                if shard not in self.available:
+                    raise KeyError(f"shard {shard} is not served here")
+                positions = array("Q")
+                with open(_shard_path(self.directory, shard, "idx"), "rb") as file:
+                    positions.frombytes(file.read())
+                opened = self._open[shard] = (BirthdaySnapshot(_shard_path(self.directory, shard, "bday")), positions)
+            return opened
+
+    def upcoming(self, shard: int, today: datetime.date,
+                 policy: BirthdayPolicy = DEFAULT_POLICY) -> tuple[list[int], list[int], list[str]]:
+        """
+        Upcoming birthdays of one shard.
+
+        Returns:
+            Three parallel lists: positions in the original user list (ascending),
+            congratulation date ordinals and names.
+        """
+        snapshot, positions = self._get(shard)
+        indices, ordinals = snapshot.upcoming_indices(today, policy)
+        return [positions[i] for i in indices], ordinals.tolist(), [snapshot.name(i) for i in indices]
+
+    def close(self) -> None:
+        """Release the memory maps of all opened shards."""
+        with self._lock:
+            for snapshot, _ in self._open.values():
+                snapshot.close()
+            self._open.clear()
+
+def _check_authkey(authkey: bytes) -> bytes:
+    """
+    Reject an empty authkey. multiprocessing.connection skips the handshake without one,
+    and the pickled requests would then be unpickled from anyone who can connect.
+    """
+    if not isinstance(authkey, bytes) or not authkey:
+        raise ValueError("authkey must be a non-empty bytes shared secret")
+    return authkey
+
+def _no_delay(connection: Connection) -> Connection:
+    """
+    Turn off Nagle's algorithm on a TCP connection. Messages over 16 KiB are written as
+    header and body separately, and delayed ACKs would otherwise hold the body back ~40 ms.
+    """
+    with socket.socket(fileno=os.dup(connection.fileno())) as sock:
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
+
+def _handle(connection: Connection, reader: ShardReader, stop: threading.Event, address, authkey: bytes) -> None:
+    """Answer requests on one connection until the client disconnects."""
+    try:
+        while True:
+            request = connection.recv()
+            try:
+                op = request[0]
+                if op == "info":
+                    response = ("ok", {"shards": reader.shards, "available": reader.available})
+                elif op == "upcoming":
+                    _, shard, today, policy = request
+                    response = ("ok", reader.upcoming(shard, today, policy))
+                elif op == "shutdown":
+                    connection.send(("ok", None))
+                    stop.set()
+                    # Wake the accept() call of serve_shards so it sees the stop flag
+                    Client(address, authkey=authkey).close()
+                    return
+                else:
+                    response = ("error", f"unknown op: {op!r}")
+            except (KeyError, IndexError, AttributeError, ValueError, TypeError, OSError) as error:
+                response = ("error", str(error))
+            connection.send(response)
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        connection.close()
+
+def serve_shards(directory: str, address, authkey: bytes, shards: Iterable[int] | None = None,
+                 ready: Connection | None = None) -> None:
+    """
+    Serve the shards of directory (all of them, or only the given shard numbers) until a
+    'shutdown' request arrives. Every connection is handled in its own thread.
+
+    Requests and responses are pickled tuples over multiprocessing.connection, so a worker
+    can run on another host. authkey is the shared secret of workers and coordinators and
+    must not be empty, because pickled messages are only safe between authenticated peers.
+    If ready is given, the bound address is sent to it once the worker accepts connections.
+    """
+    _check_authkey(authkey)
+    reader = ShardReader(directory, shards)
+    stop = threading.Event()
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.send(listener.address)
+            ready.close()
+        while not stop.is_set():
+            try:
+                connection = _no_delay(listener.accept())
+            except (AuthenticationError, OSError, EOFError):
+                # Failed handshakes (wrong authkey, dropped client) do not stop the worker
+                continue
+            threading.Thread(target=_handle, args=(connection, reader, stop, listener.address, authkey),
+                         daemon=True).start()
+    reader.close()
+
+class ShardCoordinator:
+    """
+    Fan get_upcoming_birthdays out to shard workers and merge their answers.
+
+    Every worker is asked which shards it serves; each shard is then routed to one of the
+    workers that has it, spreading shards round-robin. A query sends a request for every
+    shard that overlaps the window before reading any answer, so the workers run in parallel.
+    """
+
+    def __init__(self, addresses: Iterable, authkey: bytes):
+        _check_authkey(authkey)
+        self._connections = [_no_delay(Client(address, authkey=authkey)) for address in addresses]
+        self._lock = threading.Lock()
+        self.shards = None
+        self._route: dict[int, Connection] = {}
+        candidates: dict[int, list[Connection]] = {}
+        for connection in self._connections:
+            info = self._call(connection, ("info",))
+            if self.shards is None:
+                self.shards = info["shards"]
+            elif self.shards != info["shards"]:
+                self.close()
+                raise ValueError("workers serve shard directories with different shard counts")
+            for shard in info["available"]:
+                candidates.setdefault(shard, []).append(connection)
+        for shard, connections in candidates.items():
+            self._route[shard] = connections[shard % len(connections)]
+        missing = set(range(self.shards or 0)) - self._route.keys()
+        if missing:
+            self.close()
+            raise ValueError(f"no worker serves shards {sorted(missing)}")
+
+    def __enter__(self) -> "ShardCoordinator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _call(connection: Connection, request: tuple):
+        connection.send(request)
+        return ShardCoordinator._results([connection])[0]
+
+    @staticmethod
+    def _results(connections: list[Connection]) -> list:
+        """
+        Read one reply from each connection, in order. Every reply is read before an
+        error is raised, so no answer is left behind for the next query to pick up.
+        """
+        replies = [connection.recv() for connection in connections]
+        for status, value in replies:
+            if status != "ok":
+                raise RuntimeError(value)
+        return [value for _, value in replies]
+
+    def upcoming(self, today: datetime.date = None,
+                 policy: BirthdayPolicy = DEFAULT_POLICY) -> tuple[list[int], list[int], list[str]]:
+        """
+        Upcoming birthdays of all shards, merged into original user order.
+
+        Returns:
+            Three parallel lists: positions in the original user list, congratulation
+            date ordinals and names.
+        """
+        if today is None:
+            today = datetime.today().date()
+        with self._lock:
+            pending = []
+            for shard in shards_for_window(today, self.shards, policy):
+                connection = self._route[shard]
+                connection.send(("upcoming", shard, today, policy))
+                pending.append(connection)
+            # Each connection answers its requests in order
+            answers = self._results(pending)
+        merged = list(heapq.merge(*(zip(*answer) for answer in answers)))
+        return [item[0] for item in merged], [item[1] for item in merged], [item[2] for item in merged]
+
+    def get_upcoming_birthdays(self, today: datetime.date = None,
+                               policy: BirthdayPolicy = DEFAULT_POLICY) -> List[Dict[str, str]]:
+        """Same result as Task4.get_upcoming_birthdays for the users written by write_shards."""
+        _, ordinals, names = self.upcoming(today, policy)
+        return [{"name": name, "congratulation_date": congratulation_date}
+                for name, congratulation_date in zip(names, format_dates(ordinals))]
+
+    def shutdown(self) -> None:
+        """Ask every worker to stop, then close the connections."""
+        for connection in self._connections:
+            try:
+                self._call(connection, ("shutdown",))
+            except (EOFError, ConnectionError):
+                pass
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections to the workers (the workers keep running)."""
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+
+class LocalShardCluster:
+    """
+    Run shard workers as local processes on loopback ports, for one machine
+    and for tests. Use as a context manager; leaving it shuts the workers down.
+
+    Example:
+        >>> with LocalShardCluster("shards", workers=4) as cluster:
+        ...     cluster.coordinator.get_upcoming_birthdays()
+    """
+
+    def __init__(self, directory: str, workers: int = 2, authkey: bytes | None = None):
+        self.authkey = os.urandom(16) if authkey is None else _check_authkey(authkey)
+        self.processes = []
+        self.addresses = []
+        try:
+            for _ in range(workers):
+                receiver, sender = Pipe(duplex=False)
+                process = Process(target=serve_shards, args=(directory, ("127.0.0.1", 0), self.authkey, None, sender),
+                                  daemon=True)
+                process.start()
+                sender.close()
+                self.processes.append(process)
+                self.addresses.append(receiver.recv())
+                receiver.close()
+            self.coordinator = ShardCoordinator(self.addresses, self.authkey)
+        except BaseException:
+            self._stop_processes()
+            raise
+
+    def __enter__(self) -> "LocalShardCluster":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _stop_processes(self) -> None:
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self.processes = []
+
+    def close(self) -> None:
+        """Shut the workers down and wait for their processes to exit."""
+        self.coordinator.shutdown()
+        self._stop_processes()
+
+def main(argv: list[str] | None = None) -> None:
+    """Write shards, serve them, or query workers."""
+    parser = argparse.ArgumentParser(description="Sharded birthday index served by worker processes.")
+    parser.add_argument("--authkey", default=os.environ.get("SHARDS_AUTHKEY"),
+                        help="shared secret of workers and coordinator (default: $SHARDS_AUTHKEY); "
+                             "required by serve and by query --worker")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="write a shard directory from a .csv or .jsonl users file")
+    build.add_argument("users")
+    build.add_argument("directory")
+    build.add_argument("--shards", type=int, default=DEFAULT_SHARDS)
+    serve = commands.add_parser("serve", help="run one worker")
+    serve.add_argument("directory")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8766)
+    serve.add_argument("--shards", type=int, nargs="*", help="shard numbers to serve (default: all)")
+    query = commands.add_parser("query", help="query workers, or local ones started for a directory")
+    query.add_argument("--worker", action="append", default=[], metavar="HOST:PORT")
+    query.add_argument("--directory", help="start local workers for this directory instead")
+    query.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args(argv)
+    needs_authkey = args.command == "serve" or (args.command == "query" and args.directory is None)
+    if needs_authkey and not args.authkey:
+        parser.error("--authkey or $SHARDS_AUTHKEY is required, workers never run unauthenticated")
+    authkey = args.authkey.encode() if args.authkey else b""
+
+    if args.command == "build":
+        from Task4 import read_users
+        print(write_shards(read_users(args.users), args.directory, args.shards))
+    elif args.command == "serve":
+        serve_shards(args.directory, (args.host, args.port), authkey, args.shards)
+    elif args.directory is not None:
+        with LocalShardCluster(args.directory, args.workers) as cluster:
+            print(json.dumps(cluster.coordinator.get_upcoming_birthdays(), ensure_ascii=False, indent=2))
+    else:
+        addresses = [(host, int(port)) for host, port in (worker.rsplit(":", 1) for worker in args.worker)]
+        with ShardCoordinator(addresses, authkey) as coordinator:
+            print(json.dumps(coordinator.get_upcoming_birthdays(), ensure_ascii=False, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+import mmap
+import struct
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from Task4 import DEFAULT_POLICY, BirthdayPolicy, UpcomingColumns, congratulation_table, parse_birthday
+
+# File layout (little-endian):
+#   header:  magic b"BDAY", format version, record count, offset of the names blob
+#   records: count fixed-size records (year, month, day, name offset, name length)
+#   names:   UTF-8 names, concatenated
+MAGIC = b"BDAY"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxQQ")
+RECORD = struct.Struct("<HBBII")
+
+def write_snapshot(users: Iterable[Dict[str, str]], path: str) -> int:
+    """
+    Convert users in the get_upcoming_birthdays format ('name', 'birthday' as 'YYYY.MM.DD')
+    into a binary snapshot file. Returns the number of users written.
+    """
+    records = bytearray()
+    names = bytearray()
+    count = 0
+    for user in users:
+        birthday = parse_birthday(user["birthday"])
+        name = user["name"].encode("utf-8")
+        records += RECORD.pack(birthday.year, birthday.month, birthday.day, len(names), len(name))
+        names += name
+        count += 1
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, count, HEADER.size + len(records)))
+        file.write(records)
+        file.write(names)
+    return count
+
+class BirthdaySnapshot:
+    """
+    Read-only view of a snapshot file written by write_snapshot.
+
+    The file is memory-mapped and records are read in place through a memoryview,
+    so opening is instant and a query does not build Python objects for every user.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if not self._valid_layout():
+            self._view.release()
+            self._mmap.close()
+            raise ValueError(f"{path!r} is not a version {VERSION} birthday snapshot, or it is truncated")
+        self._records = self._view[HEADER.size:self._names_offset]
+
+    def _valid_layout(self) -> bool:
+        """Check the header, and that the records and the names blob fit in the file."""
+        size = len(self._view)
+        if size < HEADER.size:
+            return False
+        magic, version, self._count, self._names_offset = HEADER.unpack_from(self._view)
+        if magic != MAGIC or version != VERSION:
+            return False
+        records_size = self._names_offset - HEADER.size
+        if records_size < 0 or records_size % RECORD.size or records_size // RECORD.size != self._count \
+                or size < self._names_offset:
+            return False
+        if self._count:
+            # Names are written in record order, so the last record ends the names blob
+            _, _, _, offset, length = RECORD.unpack_from(self._view, self._names_offset - RECORD.size)
+            if self._names_offset + offset + length > size:
+                return False
+        return True
+
+    def __enter__(self) -> "BirthdaySnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._records.release()
+        self._view.release()
+        self._mmap.close()
+
+    def name(self, index: int) -> str:
+        """Return the name of the user at index."""
+        _, _, _, offset, length = RECORD.unpack_from(self._records, index * RECORD.size)
+        start = self._names_offset + offset
+        return str(self._view[start:start + length], "utf-8")
+
+    def upcoming_indices(self, today: datetime.date = None,
+                         policy: BirthdayPolicy = DEFAULT_POLICY) -> tuple[array, array]:
+        """
+        Find users whose birthdays are within the next 7 days (including today),
+        or within the window of the given policy.
+
+        Returns:
+            Two parallel arrays: user indices ('L') and congratulation date ordinals ('l'),
+            in file order.
+        """
+        if today is None:
+            today = datetime.today().date()
+        window = {key: congratulation_date.toordinal() for key, congratulation_date in congratulation_table(today, policy).items()}
+        today_key = (today.year, today.month, today.day)
+
+        indices = array("L")
+        ordinals = array("l")
+        for index, (year, month, day, _, _) in enumerate(RECORD.iter_unpack(self._records)):
+            ordinal = window.get((month, day))
+            # Skip users with future birth dates (not yet born)
+            if ordinal is None or (year, month, day) > today_key:
+                continue
+            indices.append(index)
+            ordinals.append(ordinal)
+        return indices, ordinals
+
+    def upcoming(self, today: datetime.date = None, policy: BirthdayPolicy = DEFAULT_POLICY) -> UpcomingColumns:
+        """The result of upcoming_indices as UpcomingColumns."""
+        return UpcomingColumns(*self.upcoming_indices(today, policy), self.name)
+
+    def get_upcoming_birthdays(self, today: datetime.date = None,
+                               policy: BirthdayPolicy = DEFAULT_POLICY) -> List[Dict[str, str]]:
+        """Same result as Task4.get_upcoming_birthdays for the users in the snapshot."""
+        return self.upcoming(today, policy).to_dicts()
@@ -0,0 +1,52 @@
+"""
+Lazy entry point for the Task modules.
+
+``import tasks`` loads nothing else; each Task module is imported the first time
+one of its names is used, e.g. ``tasks.normalize_phone`` imports only Task3.
+"""
+import importlib
+
+# Public name -> module that defines it
+_EXPORTS = {
+    "get_days_from_today": "Task1",
+    "get_days_from_today_batch": "Task1",
+    "DaysCalculator": "Task1",
+    "get_numbers_ticket": "Task2",
+    "generate_tickets": "Task2",
+    "ticket_rows": "Task2",
+    "TicketService": "Task2",
+    "normalize_phone": "Task3",
+    "normalize_phones": "Task3",
+    "normalize_phones_unique": "Task3",
+    "classify_phone": "Task3",
+    "validate_phones": "Task3",
+    "normalize_phone_international": "Task3",
+    "get_upcoming_birthdays": "Task4",
+    "iter_upcoming_birthdays": "Task4",
+    "read_users": "Task4",
+    "write_upcoming_birthdays": "Task4",
+    "congratulation_table": "Task4",
+    "get_upcoming_birthdays_columnar": "Task4",
+    "UpcomingColumns": "Task4",
+    "format_dates": "Task4",
+    "BirthdayPolicy": "Task4",
+    "BirthdayIndex": "Task4",
+    "UpcomingBirthdaysTracker": "Task4",
+    "UserStore": "Task4",
+    "BirthdayCalendar": "Task4",
+}
+_MODULES = ("Task1", "Task2", "Task3", "Task4")
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return importlib.import_module(name)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Not cached here, so enabling instrumentation on a Task module is seen through this package too
+    return getattr(importlib.import_module(module_name), name)
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
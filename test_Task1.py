@@ -1,6 +1,7 @@
 import unittest
-from Task1 import get_days_from_today
-from datetime import datetime
+from Task1 import get_days_from_today, get_days_from_today_batch, DaysCalculator
+from dates import clear_parse_cache, parse_cache_info
+from datetime import date, datetime, timedelta, timezone
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -48,5 +49,88 @@ class TestTask1(TestCase):
             from Task1 import get_days_from_today
             self.assertEqual(get_days_from_today("2021-10-09"), -157)
 
+class TestGetDaysFromTodayBatch(TestCase):
+    def test_matches_single_item_function(self):
+        dates = ["2999-01-01", datetime.now().strftime("%Y-%m-%d"), "2000-01-01", "1800-01-01",
+                 "2020-1-1", "01-01-2020", "2023-02-30", 12345, "", None, " 2020-01-01 ", "2020/01/01"]
+        deltas, mask = get_days_from_today_batch(dates)
+        for value, delta, valid in zip(dates, deltas, mask):
+            expected = get_days_from_today(value)
+            if valid:
+                self.assertEqual(delta, expected)
+            else:
+                self.assertEqual(expected, "Invalid date format")
+
+    def test_today_sampled_once(self):
+        with patch('Task1.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2021, 5, 5)
+            mock_datetime.strptime.side_effect = lambda *args, **kwargs: datetime.strptime(*args, **kwargs)
+            deltas, mask = get_days_from_today_batch(["2021-10-09", "2021-05-04", "bad"])
+            self.assertEqual(list(deltas), [-157, 1, 0])
+            self.assertEqual(list(mask), [1, 1, 0])
+            self.assertEqual(mock_datetime.now.call_count, 1)
+
+class TestDaysCalculator(TestCase):
+    def test_fixed_clock(self):
+        calculator = DaysCalculator(clock=lambda: datetime(2021, 5, 5))
+        self.assertEqual(calculator.today, date(2021, 5, 5))
+        self.assertEqual(calculator.days_from("2021-10-09"), -157)
+        self.assertEqual(calculator.days_from(date(2021, 5, 4)), 1)
+        self.assertEqual(calculator.days_from(datetime(2021, 5, 6, 23, 59)), -1)
+
+    def test_clock_read_once(self):
+        calls = []
+        def clock():
+            calls.append(1)
+            return datetime(2021, 5, 5, 23, 59, 59)
+        calculator = DaysCalculator(clock=clock)
+        calculator.days_from_many(["2021-05-05"] * 100)
+        self.assertEqual(len(calls), 1)
+
+    def test_mixed_inputs_match_reference(self):
+        today = datetime.now()
+        calculator = DaysCalculator()
+        values = ["2999-01-01", today.strftime("%Y-%m-%d"), "2000-01-01", "01-01-2020", "2023-02-30",
+                  "", None, " 2020-01-01 ", "2020/01/01", [], True]
+        self.assertEqual(calculator.days_from_many(values), [get_days_from_today(v) for v in values])
+
+    def test_timestamps_and_time_zones(self):
+        kyiv = timezone(timedelta(hours=3))
+        # 2021-05-04 22:30 UTC is already 2021-05-05 in UTC+3
+        clock = lambda: datetime(2021, 5, 4, 22, 30, tzinfo=timezone.utc)
+        self.assertEqual(DaysCalculator(tz=kyiv, clock=clock).today, date(2021, 5, 5))
+        self.assertEqual(DaysCalculator(tz=timezone.utc, clock=clock).today, date(2021, 5, 4))
+        calculator = DaysCalculator(tz=timezone.utc, clock=clock)
+        timestamp = datetime(2021, 5, 1, tzinfo=timezone.utc).timestamp()
+        self.assertEqual(calculator.days_from_many([int(timestamp), timestamp]), [3, 3])
+        self.assertEqual(calculator.days_from(10 ** 20), "Invalid date format")
+
+    def test_subclasses_use_base_converter(self):
+        class Name(str):
+            pass
+        class Day(date):
+            pass
+        class Moment(datetime):
+            pass
+        calculator = DaysCalculator(clock=lambda: datetime(2021, 5, 5))
+        self.assertEqual(calculator.days_from_many([Name("2021-05-04"), Day(2021, 5, 3), Moment(2021, 5, 6, 12)]),
+                         [1, 2, -1])
+        self.assertEqual(calculator.days_from(Name("bad")), "Invalid date format")
+        self.assertEqual(calculator.days_from(False), "Invalid date format")
+
+    def test_malformed_strings_skip_the_parser(self):
+        calculator = DaysCalculator(clock=lambda: datetime(2021, 5, 5))
+        with patch('Task1.parse_date') as parse:
+            self.assertEqual(calculator.days_from_many(["bad", "", "2020/01/01", "01-01-2020"]),
+                             ["Invalid date format"] * 4)
+        parse.assert_not_called()
+        self.assertEqual(calculator.days_from("2021-5-4"), 1)
+
+    def test_strings_use_shared_parse_cache(self):
+        clear_parse_cache()
+        calculator = DaysCalculator(clock=lambda: datetime(2021, 5, 5))
+        calculator.days_from_many(["2021-05-04"] * 3)
+        self.assertEqual(parse_cache_info().hits, 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -1,5 +1,6 @@
+import threading
 import unittest
-from Task2 import get_numbers_ticket
+from Task2 import get_numbers_ticket, generate_tickets, ticket_rows, TicketService, CHECKPOINT_INTERVAL
 
 class TestGetNumbersTicket(unittest.TestCase):
     def test_normal_case(self):
@@ -78,5 +79,121 @@ class TestGetNumbersTicket(unittest.TestCase):
         # quantity is greater than the number of values in the range (1-1000) — should return []
         self.assertEqual(get_numbers_ticket(1, 1000, 1001), [])
 
+    def test_negative_quantity(self):
+        # quantity is negative — should return []
+        self.assertEqual(get_numbers_ticket(1, 10, -1), [])
+
+class TestGenerateTickets(unittest.TestCase):
+    def test_rows(self):
+        # Every row is a sorted ticket of unique numbers in range
+        tickets = generate_tickets(1, 49, 6, 1000, seed=7)
+        self.assertEqual(tickets.typecode, 'H')
+        self.assertEqual(len(tickets), 6000)
+        for start in range(0, len(tickets), 6):
+            row = list(tickets[start:start + 6])
+            self.assertEqual(sorted(set(row)), row)
+            self.assertTrue(all(1 <= x <= 49 for x in row))
+
+    def test_seed_reproducible(self):
+        # The same seed gives the same draw
+        self.assertEqual(generate_tickets(1, 1000, 10, 500, seed=42), generate_tickets(1, 1000, 10, 500, seed=42))
+        self.assertNotEqual(generate_tickets(1, 1000, 10, 500, seed=1), generate_tickets(1, 1000, 10, 500, seed=2))
+
+    def test_full_range(self):
+        # quantity equals the size of the range — every row is the whole range
+        self.assertEqual(list(generate_tickets(1, 6, 6, 2)), [1, 2, 3, 4, 5, 6] * 2)
+
+    def test_wide_and_high_ranges(self):
+        # Ranges above 255 draw two bytes per number
+        for min, max, quantity in [(1, 1000, 10), (900, 1000, 5), (250, 260, 2)]:
+            rows = ticket_rows(generate_tickets(min, max, quantity, 500, seed=3), quantity).tolist()
+            self.assertEqual(len(rows), 500)
+            for row in rows:
+                self.assertEqual(sorted(set(row)), row)
+                self.assertTrue(all(min <= x <= max for x in row))
+
+    def test_numbers_are_uniform(self):
+        # Every number of 1-10 appears in about 3/10 of the tickets, and so does every pair of numbers in 3/10 * 2/9
+        rows = ticket_rows(generate_tickets(1, 10, 3, 30000, seed=5), 3).tolist()
+        counts = [0] * 11
+        for row in rows:
+            for number in row:
+                counts[number] += 1
+        for number in range(1, 11):
+            self.assertAlmostEqual(counts[number] / 30000, 0.3, delta=0.02)
+        pairs = sum(1 for row in rows if 1 in row and 10 in row)
+        self.assertAlmostEqual(pairs / 30000, 0.3 * 2 / 9, delta=0.01)
+
+    def test_ticket_rows(self):
+        tickets = generate_tickets(1, 49, 6, 4, seed=7)
+        rows = ticket_rows(tickets, 6)
+        self.assertEqual(rows.shape, (4, 6))
+        self.assertEqual(rows.tolist()[2], list(tickets[12:18]))
+        self.assertEqual(rows[3, 5], tickets[23])
+        self.assertEqual(ticket_rows(generate_tickets(1, 5, 10, 3), 10).tolist(), [])
+
+    def test_invalid_input(self):
+        # Same validation rules as get_numbers_ticket, plus count >= 1
+        for args in [(1, 5, 10), (10, 5, 3), (1, 10, 0), (1, 1001, 5), (0, 10, 5), (1, 10, -1)]:
+            self.assertEqual(len(generate_tickets(*args, 10)), 0)
+        self.assertEqual(len(generate_tickets(1, 10, 5, 0)), 0)
+
+class TestTicketService(unittest.TestCase):
+    def test_rules(self):
+        # Same validation and output format as get_numbers_ticket
+        service = TicketService(seed=1)
+        ticket = service.issue(1, 49, 6)
+        self.assertEqual(len(set(ticket)), 6)
+        self.assertEqual(sorted(ticket), ticket)
+        self.assertEqual(service.issue(1, 5, 10), [])
+        self.assertEqual(service.issue(0, 10, 5), [])
+        self.assertEqual(len(service.records), 1)
+
+    def test_threads_and_replay(self):
+        # Tickets from many threads are recorded with distinct (stream, position) and replay exactly
+        service = TicketService(seed=42)
+        def draw():
+            for _ in range(50):
+                service.issue(1, 1000, 10)
+        threads = [threading.Thread(target=draw) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(service.records), 200)
+        self.assertEqual(len({(r.stream, r.position) for r in service.records}), 200)
+        self.assertEqual({r.stream for r in service.records}, {0, 1, 2, 3})
+        for record in service.records:
+            self.assertEqual(service.replay(record), record.numbers)
+
+    def test_seed_reproducible(self):
+        # The same seed gives the same stream of tickets
+        first = TicketService(seed=7)
+        second = TicketService(seed=7)
+        self.assertEqual([first.issue(1, 49, 6) for _ in range(5)], [second.issue(1, 49, 6) for _ in range(5)])
+        self.assertNotEqual([TicketService(seed=7, worker=1).issue(1, 49, 6) for _ in range(5)],
+                            [TicketService(seed=7).issue(1, 49, 6) for _ in range(5)])
+
+    def test_replay_across_checkpoints(self):
+        # Mixed ticket shapes on one stream, past several checkpoints
+        service = TicketService(seed=3)
+        shapes = [(1, 49, 6), (1, 1000, 10), (5, 20, 3)]
+        for i in range(2 * CHECKPOINT_INTERVAL + 10):
+            service.issue(*shapes[i % 3])
+        for position in (0, 1, CHECKPOINT_INTERVAL - 1, CHECKPOINT_INTERVAL, 2 * CHECKPOINT_INTERVAL + 9):
+            record = service.records[position]
+            self.assertEqual(service.replay(record), record.numbers)
+        with self.assertRaises(ValueError):
+            TicketService(seed=4).replay(service.records[0])
+
+    def test_seed_and_worker_ranges(self):
+        # Negative seeds would draw the same tickets as positive ones, large workers would overlap the seed
+        with self.assertRaises(ValueError):
+            TicketService(seed=-1)
+        with self.assertRaises(ValueError):
+            TicketService(seed=1, worker=2 ** 32)
+        with self.assertRaises(ValueError):
+            TicketService(seed=1, worker=-1)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -1,5 +1,7 @@
+import os
+import tempfile
 import unittest
-from Task3 import normalize_phone
+from Task3 import normalize_phone, normalize_phones, normalize_phones_unique, validate_phones, PHONE_EMPTY, classify_phone, normalize_phone_international
 
 class TestNormalizePhone(unittest.TestCase):
     def test_valid_ukrainian_formats(self):
@@ -94,5 +96,94 @@ class TestNormalizePhone(unittest.TestCase):
         # Digits separated by spaces, starts with 0 (should become +380501234567)
         self.assertEqual(normalize_phone("0 5 0 1 2 3 4 5 6 7"), "+380501234567")
 
+    def test_bulk_normalize(self):
+        """Test that normalize_phones gives the same results as normalize_phone."""
+        raw_numbers = [
+            "067\t123 4567", "+380 44 123 4567", "38+0501234567", "050+3451234",
+            "12345", "+380501234567890", "abc+380501234567", "+", "",
+            "00380501234567", "++380501234567", "0 5 0 1 2 3 4 5 6 7", "1+2+3",
+        ]
+        self.assertEqual(normalize_phones(raw_numbers), [normalize_phone(num) for num in raw_numbers])
+        self.assertEqual(normalize_phones(iter([])), [])
+
+class TestValidatePhones(unittest.TestCase):
+    def test_status_codes(self):
+        """Test the status code and reason counts of each kind of input."""
+        raw_numbers = ["067\t123 4567", "00380501234567", "00", "", "+", "12345", "+380501234567890", "++380501234567"]
+        statuses, counts = validate_phones(raw_numbers)
+        self.assertIsInstance(statuses, bytearray)
+        self.assertEqual(list(statuses), [0, 1, 2, 3, 3, 4, 5, 0])
+        self.assertEqual(counts, {"valid": 2, "prefix_00": 1, "prefix_00_short": 1,
+                                  "empty": 2, "too_short": 1, "too_long": 1})
+
+    def test_matches_normalize_phone(self):
+        """Test that a number is accepted exactly when normalize_phone returns a non-empty string."""
+        raw_numbers = ["38+0501234567", "050+3451234", "(0+50)8889900", "+38012", "abc+380501234567",
+                       "0+0123456789", "+0 0123456789", "0 5 0 1 2 3 4 5 6 7", "1234567890123"]
+        statuses, _ = validate_phones(raw_numbers)
+        for number, status in zip(raw_numbers, statuses):
+            self.assertEqual(status < PHONE_EMPTY, normalize_phone(number) != '', number)
+
+class TestNormalizePhonesUnique(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "phones.txt")
+        self.raw_numbers = [
+            "067\t123 4567", "+380 67 123 4567", "380671234567", "(095) 234-5678",
+            "12345", "+380501234567890", "0503451234", "050 345 12 34", "abc",
+        ] * 7
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n".join(self.raw_numbers) + "\n\n")
+
+    def test_serial(self):
+        """Test that duplicates are merged and rejected inputs are counted."""
+        unique, rejected = normalize_phones_unique(self.path, chunk_size=4)
+        self.assertEqual(unique, {"+380671234567", "+380952345678", "+380503451234"})
+        self.assertEqual(rejected, 21)
+
+    def test_parallel(self):
+        """Test that worker processes give the same result."""
+        self.assertEqual(normalize_phones_unique(self.path, workers=2, chunk_size=4),
+                         normalize_phones_unique(self.path))
+
+class TestInternationalRules(unittest.TestCase):
+    def test_ukrainian_numbers(self):
+        """Test that Ukrainian numbers get the same result as normalize_phone."""
+        for number in ["067\t123 4567", "(095) 234-5678\n", "+380 44 123 4567", "380501234567",
+                       "    +38(050)123-32-34", "501234567", "00380501234567", "++380501234567"]:
+            self.assertEqual(classify_phone(number), ("UA", normalize_phone(number)))
+
+    def test_other_countries(self):
+        """Test numbers matched by country code."""
+        self.assertEqual(classify_phone("+44 (0) 20 7946 0958"), ("GB", "+442079460958"))
+        self.assertEqual(classify_phone("0044 20 7946 0958"), ("GB", "+442079460958"))
+        self.assertEqual(classify_phone("+1 212 555 0100"), ("US", "+12125550100"))
+        self.assertEqual(classify_phone("  +7 (495) 123-45-67"), ("RU", "+74951234567"))
+        self.assertEqual(classify_phone("+420 601 123 456"), ("CZ", "+420601123456"))
+
+    def test_default_country(self):
+        """Test national numbers read with a non-Ukrainian default country."""
+        self.assertEqual(classify_phone("020 7946 0958", "GB"), ("GB", "+442079460958"))
+        self.assertEqual(classify_phone("8 (495) 123-45-67", "RU"), ("RU", "+74951234567"))
+        with self.assertRaises(ValueError):
+            classify_phone("0501234567", "XX")
+
+    def test_trunk_prefix_stripped_when_lengths_overlap(self):
+        """Test countries whose valid lengths also fit the number with its trunk prefix."""
+        self.assertEqual(classify_phone("030 1234567", "DE"), ("DE", "+49301234567"))
+        self.assertEqual(classify_phone("+49 (0)30 1234567"), ("DE", "+49301234567"))
+        self.assertEqual(classify_phone("30 1234567", "DE"), ("DE", "+49301234567"))
+        self.assertEqual(classify_phone("010 1234 5678", "CN"), ("CN", "+861012345678"))
+        self.assertEqual(classify_phone("+86 10 1234 5678"), ("CN", "+861012345678"))
+
+    def test_invalid(self):
+        """Test unknown country codes and wrong lengths."""
+        self.assertEqual(classify_phone("+999 123 456"), ("", ""))
+        self.assertEqual(classify_phone("+380 50 123"), ("", ""))
+        self.assertEqual(classify_phone("12345"), ("", ""))
+        self.assertEqual(normalize_phone_international(""), "")
+        self.assertEqual(normalize_phone_international("+49 30 123456"), "+4930123456")
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
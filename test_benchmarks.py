@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks import compare_to_baseline, load_baseline, run_benchmarks, save_baseline
+
+class TestBenchmarks(unittest.TestCase):
+    def test_run_benchmarks_reports_every_size(self):
+        results = run_benchmarks((10, 20), repeat=1, pattern="normalize_phones")
+        self.assertEqual(list(results), ["Task3.normalize_phones[10]", "Task3.normalize_phones[20]"])
+        for measured in results.values():
+            self.assertGreater(measured["us_per_item"], 0)
+            self.assertGreater(measured["items_per_second"], 0)
+            self.assertGreater(measured["peak_bytes"], 0)
+
+    def test_baseline_round_trip(self):
+        results = {"a[10]": {"us_per_item": 1.0, "items_per_second": 1e6, "peak_bytes": 100}}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(results, path)
+            self.assertEqual(load_baseline(path), results)
+
+    def test_compare_to_baseline(self):
+        baseline = {
+            "a[10]": {"us_per_item": 1.0, "peak_bytes": 1000},
+            "b[10]": {"us_per_item": 1.0, "peak_bytes": 1000},
+        }
+        results = {
+            "a[10]": {"us_per_item": 1.09, "peak_bytes": 1200},
+            "b[10]": {"us_per_item": 1.2, "peak_bytes": 1000},
+            "new[10]": {"us_per_item": 50.0, "peak_bytes": 1},
+        }
+        self.assertEqual(compare_to_baseline(results, baseline, tolerance=10),
+                         {"a[10]": ["peak_bytes"], "b[10]": ["us_per_item"]})
+        self.assertEqual(compare_to_baseline(results, baseline, tolerance=25), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from datetime import date, datetime
+import dates
+from dates import parse_date, parse_cache_info, clear_parse_cache, set_parse_cache_size
+
+class TestParseDate(unittest.TestCase):
+    def setUp(self):
+        clear_parse_cache()
+
+    def tearDown(self):
+        set_parse_cache_size(dates.PARSE_CACHE_SIZE)
+
+    def test_fixed_width_formats(self):
+        self.assertEqual(parse_date("2024-01-22"), date(2024, 1, 22))
+        self.assertEqual(parse_date("2024.01.22", "%Y.%m.%d"), date(2024, 1, 22))
+
+    def test_matches_strptime(self):
+        # Non-padded strings go through strptime and give the same result
+        self.assertEqual(parse_date("2024-1-2"), datetime.strptime("2024-1-2", "%Y-%m-%d").date())
+        self.assertEqual(parse_date("22/01/2024", "%d/%m/%Y"), date(2024, 1, 22))
+
+    def test_invalid_dates(self):
+        for value in ["2023-02-30", "01-01-2020", "2020/01/01", " 2020-01-01 ", "", "2020-01-0x"]:
+            with self.assertRaises(ValueError):
+                parse_date(value)
+        with self.assertRaises(ValueError):
+            parse_date("2024-01-22", "%Y.%m.%d")
+        for value in [None, 12345]:
+            with self.assertRaises(TypeError):
+                parse_date(value)
+
+    def test_hit_and_miss_counters(self):
+        parse_date("2024-01-22")
+        parse_date("2024-01-22")
+        parse_date("2024.01.22", "%Y.%m.%d")
+        info = parse_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_bounded_size(self):
+        set_parse_cache_size(2)
+        for day in range(1, 6):
+            parse_date(f"2024-01-0{day}")
+        info = parse_cache_info()
+        self.assertEqual((info.maxsize, info.currsize), (2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
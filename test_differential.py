@@ -0,0 +1,42 @@
+import random
+import unittest
+from datetime import date
+
+from differential import CHECKS, Check, random_users, reference_upcoming_birthdays, run_check, shrink
+from dates import parse_date
+
+class TestDifferential(unittest.TestCase):
+    def test_fast_paths_match_reference(self):
+        for name, check in CHECKS.items():
+            with self.subTest(name):
+                mismatch, _, _ = run_check(name, check, cases=200, seed=1)
+                self.assertIsNone(mismatch)
+
+    def test_reference_handles_leap_day_and_saturday_feb_28(self):
+        # 2026.02.28 is a Saturday and 2026 is not a leap year: adjust_weekend_date moves it by one day only
+        users = [{"name": "Leap", "birthday": "2000.02.29"}, {"name": "Feb 28", "birthday": "1990.02.28"}]
+        self.assertEqual(reference_upcoming_birthdays(users, date(2026, 2, 25)), [
+            {"name": "Leap", "congratulation_date": "2026.03.01"},
+            {"name": "Feb 28", "congratulation_date": "2026.03.01"},
+        ])
+
+    def test_generated_users_cover_leap_day(self):
+        users = random_users(random.Random(0), date(2026, 2, 25), size=200)
+        self.assertIn("02.29", {user["birthday"][5:] for user in users})
+
+    def test_shrink_finds_minimal_case(self):
+        fails = lambda case: "x" in case[0] and len(case[1]) > 2
+        self.assertEqual(shrink(("abxcd", [1, 2, 3, 4, 5]), fails), ("x", [3, 4, 5]))
+
+    def test_reports_shrunk_mismatch(self):
+        buggy = Check(sorted, lambda items: sorted(items)[:3], lambda rng: ([rng.randrange(10) for _ in range(8)],))
+        mismatch, _, _ = run_check("buggy", buggy, cases=10)
+        self.assertEqual(len(mismatch.case[0]), 4)
+        self.assertEqual(mismatch.expected, sorted(mismatch.case[0]))
+
+    def test_non_ascii_digits_are_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_date("٢٠٢٠-٠١-٠١")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import threading
+import unittest
+import instrumentation
+import Task1
+import Task2
+import Task3
+import Task4
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+
+    def test_disabled_is_original(self):
+        original = Task3.normalize_phone
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(Task3.normalize_phone, original)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(Task3.normalize_phone, original)
+
+    def test_counts_calls_items_and_invalid(self):
+        instrumentation.enable()
+        Task1.get_days_from_today("2020-01-01")
+        Task1.get_days_from_today("bad")
+        Task2.get_numbers_ticket(1, 6, 6)
+        Task2.get_numbers_ticket(0, 6, 6)
+        self.assertEqual(Task3.normalize_phone("067\t123 4567"), "+380671234567")
+        Task3.normalize_phone("123")
+        Task4.get_upcoming_birthdays([{"name": "A", "birthday": "1990.01.01"}] * 3)
+        data = instrumentation.snapshot()
+        self.assertEqual(data["get_days_from_today"]["calls"], 2)
+        self.assertEqual(data["get_days_from_today"]["invalid"], 1)
+        self.assertEqual(data["get_numbers_ticket"]["invalid"], 1)
+        self.assertEqual(data["normalize_phone"]["invalid"], 1)
+        self.assertEqual(data["get_upcoming_birthdays"]["items"], 3)
+        self.assertEqual(data["normalize_phone"]["latency_histogram"][-1][1], 2)
+
+    def test_threads_are_summed(self):
+        instrumentation.enable()
+        def work():
+            for _ in range(100):
+                Task3.normalize_phone("0501234567")
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(instrumentation.snapshot()["normalize_phone"]["calls"], 400)
+
+    def test_ended_threads_are_folded_into_totals(self):
+        instrumentation.enable()
+        live = len(instrumentation._thread_stats)
+        for _ in range(20):
+            thread = threading.Thread(target=Task3.normalize_phone, args=("0501234567",))
+            thread.start()
+            thread.join()
+        self.assertLessEqual(len(instrumentation._thread_stats), live + 1)
+        self.assertEqual(instrumentation.snapshot()["normalize_phone"]["calls"], 20)
+
+    def test_exceptions_are_counted_as_invalid(self):
+        instrumentation.enable()
+        with self.assertRaises(ValueError):
+            Task4.get_upcoming_birthdays([{"name": "A", "birthday": "1990.13.40"}])
+        Task4.get_upcoming_birthdays([{"name": "A", "birthday": "1990.01.01"}])
+        data = instrumentation.snapshot()["get_upcoming_birthdays"]
+        self.assertEqual((data["calls"], data["invalid"], data["items"]), (2, 1, 2))
+
+    def test_exports(self):
+        instrumentation.enable()
+        Task3.normalize_phone("0501234567")
+        data = json.loads(instrumentation.export_json())
+        self.assertEqual(data["normalize_phone"]["calls"], 1)
+        self.assertIsNone(data["normalize_phone"]["latency_histogram"][-1][0])
+        text = instrumentation.export_prometheus()
+        self.assertIn('task_calls_total{function="normalize_phone"} 1', text)
+        self.assertIn('task_latency_seconds_bucket{function="normalize_phone",le="+Inf"} 1', text)
+        self.assertIn('task_latency_seconds_count{function="normalize_phone"} 1', text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from service import MicroBatcher, TaskService, percentile, run_load
+from Task3 import normalize_phone
+
+class TestMicroBatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_requests_share_a_batch(self):
+        calls = []
+        def func(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+        batcher = MicroBatcher(func, delay=0.01)
+        batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        finally:
+            await batcher.stop()
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+        self.assertEqual(calls, [[0, 1, 2, 3, 4]])
+
+    async def test_max_batch(self):
+        batcher = MicroBatcher(lambda items: items, max_batch=2, delay=0.01)
+        batcher.start()
+        try:
+            await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        finally:
+            await batcher.stop()
+        self.assertEqual(batcher.batches, 3)
+
+    async def test_errors_reach_every_caller(self):
+        def func(items):
+            raise ValueError("boom")
+        batcher = MicroBatcher(func)
+        batcher.start()
+        try:
+            with self.assertRaises(ValueError):
+                await batcher.submit(1)
+            first, second = await asyncio.gather(batcher.submit(2), batcher.submit(3), return_exceptions=True)
+        finally:
+            await batcher.stop()
+        # Every caller gets its own exception object
+        self.assertIsInstance(first, ValueError)
+        self.assertIsInstance(second, ValueError)
+        self.assertIsNot(first, second)
+        self.assertEqual(str(second), "boom")
+
+    async def test_stop_cancels_queued_requests(self):
+        batcher = MicroBatcher(lambda items: items, delay=10)
+        batcher.start()
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+        with self.assertRaises(asyncio.CancelledError):
+            await batcher.submit(4)
+
+    async def test_stop_cancels_requests_never_dequeued(self):
+        batcher = MicroBatcher(lambda items: items)
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        await batcher.stop()
+        results = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+        self.assertTrue(all(isinstance(result, asyncio.CancelledError) for result in results))
+
+class TestTaskService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = TaskService()
+        self.host, self.port = await self.service.start()
+
+    async def asyncTearDown(self):
+        await self.service.stop()
+
+    async def request(self, payload):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(json.dumps(payload).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+
+    async def test_normalize_phone(self):
+        response = await self.request({"op": "normalize_phone", "phone": "067\t123 4567"})
+        self.assertEqual(response, {"result": normalize_phone("067\t123 4567")})
+
+    @patch('Task4.datetime')
+    @patch('service.datetime')
+    async def test_get_upcoming_birthdays(self, service_datetime, task_datetime):
+        service_datetime.today.return_value = datetime(2024, 1, 22)
+        task_datetime.strptime = datetime.strptime
+        users = [{"name": "John Doe", "birthday": "1985.01.23"}, {"name": "Charlie Davis", "birthday": "1987.01.30"}]
+        response = await self.request({"op": "get_upcoming_birthdays", "users": users})
+        self.assertEqual(response, {"result": [{"name": "John Doe", "congratulation_date": "2024.01.23"}]})
+
+    async def test_errors(self):
+        self.assertIn("error", await self.request({"op": "unknown"}))
+        self.assertIn("error", await self.request({"op": "normalize_phone", "phone": 123}))
+        self.assertIn("error", await self.request({"op": "get_upcoming_birthdays", "users": "x"}))
+        self.assertIn("error", await self.request([]))
+        bad_users = [{"name": "Bad", "birthday": "not-a-date"}]
+        self.assertIn("error", await self.request({"op": "get_upcoming_birthdays", "users": bad_users}))
+
+    async def test_load_and_stats(self):
+        report = await run_load(self.host, self.port, connections=10, requests=20)
+        self.assertEqual(report["requests"], 200)
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+        stats = (await self.request({"op": "stats"}))["result"]
+        self.assertEqual(stats["count"], 200)
+        self.assertLess(stats["phone_batches"], 200)
+
+class TestPercentile(unittest.TestCase):
+    def test_percentile(self):
+        self.assertEqual(percentile([], 0.5), 0.0)
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+        self.assertEqual(percentile(list(range(100)), 0.99), 99)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from datetime import date
+from multiprocessing import AuthenticationError, Pipe, Process
+from multiprocessing.connection import Client
+from unittest.mock import patch
+
+from shards import LocalShardCluster, ShardCoordinator, main, serve_shards, shard_of, shards_for_window, write_shards
+from Task4 import BirthdayPolicy, get_upcoming_birthdays_columnar
+
+class TestShards(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "New Year", "birthday": "1980.12.31"},
+            {"name": "Олена Коваль", "birthday": "1991.01.22"},
+            {"name": "Future User", "birthday": "2025.01.23"},
+            {"name": "Leap Day User", "birthday": "1996.02.29"},
+            {"name": "Feb 28", "birthday": "1993.02.28"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+        ]
+        cls.count = write_shards(cls.users, cls.directory.name, shards=12)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def expected(self, today, policy=BirthdayPolicy()):
+        return get_upcoming_birthdays_columnar(self.users, today, policy).to_dicts()
+
+    def start_worker(self, authkey, shards=None):
+        receiver, sender = Pipe(duplex=False)
+        process = Process(target=serve_shards, args=(self.directory.name, ("127.0.0.1", 0), authkey, shards, sender))
+        process.start()
+        sender.close()
+        self.addCleanup(process.join, 5)
+        return receiver.recv()
+
+    def test_partitioning(self):
+        self.assertEqual(self.count, 8)
+        self.assertEqual(shard_of(1, 1, 12), 0)
+        self.assertEqual(shard_of(12, 31, 12), 11)
+        self.assertNotEqual(shard_of(2, 28, 366), shard_of(2, 29, 366))
+        self.assertEqual(shards_for_window(date(2024, 1, 22), 12), [0])
+        self.assertEqual(shards_for_window(date(2023, 12, 28), 12), [0, 11])
+
+    def test_matches_get_upcoming_birthdays(self):
+        with LocalShardCluster(self.directory.name, workers=3) as cluster:
+            for today in (date(2024, 1, 22), date(2023, 12, 28), date(2026, 2, 25), date(2025, 2, 24)):
+                with self.subTest(today=today):
+                    self.assertEqual(cluster.coordinator.get_upcoming_birthdays(today), self.expected(today))
+            policy = BirthdayPolicy(window_days=60)
+            self.assertEqual(cluster.coordinator.get_upcoming_birthdays(date(2024, 1, 1), policy),
+                             self.expected(date(2024, 1, 1), policy))
+
+    def test_workers_with_disjoint_shards(self):
+        # Two "hosts", each serving half of the year
+        authkey = b"secret"
+        addresses = [self.start_worker(authkey, range(0, 6)), self.start_worker(authkey, range(6, 12))]
+        with ShardCoordinator(addresses, authkey) as coordinator:
+            self.assertEqual(coordinator.get_upcoming_birthdays(date(2023, 12, 28)), self.expected(date(2023, 12, 28)))
+            coordinator.shutdown()
+
+    def test_missing_shards_and_wrong_authkey(self):
+        authkey = b"secret"
+        address = self.start_worker(authkey, range(0, 6))
+        with self.assertRaises(AuthenticationError):
+            Client(address, authkey=b"wrong")
+        with self.assertRaisesRegex(ValueError, r"no worker serves shards \[6, 7, 8, 9, 10, 11\]"):
+            ShardCoordinator([address], authkey)
+        # The worker is still up after the failed handshake
+        connection = Client(address, authkey=authkey)
+        connection.send(("shutdown",))
+        self.assertEqual(connection.recv(), ("ok", None))
+        connection.close()
+
+    def test_empty_authkey_is_rejected(self):
+        with self.assertRaises(ValueError):
+            serve_shards(self.directory.name, ("127.0.0.1", 0), b"")
+        with self.assertRaises(ValueError):
+            ShardCoordinator([("127.0.0.1", 1)], b"")
+        with self.assertRaises(ValueError):
+            LocalShardCluster(self.directory.name, authkey=b"")
+        environ = {key: value for key, value in os.environ.items() if key != "SHARDS_AUTHKEY"}
+        with patch.dict(os.environ, environ, clear=True), redirect_stderr(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main(["serve", self.directory.name])
+
+    def test_error_reply_does_not_leave_stale_answers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            write_shards([{"name": "Jan", "birthday": "1990.01.01"}, {"name": "Dec", "birthday": "1990.12.31"}],
+                         directory, shards=12)
+            os.remove(os.path.join(directory, "shard-000.bday"))
+            with LocalShardCluster(directory, workers=1) as cluster:
+                with self.assertRaises(RuntimeError):
+                    cluster.coordinator.get_upcoming_birthdays(date(2023, 12, 28))
+                self.assertEqual(cluster.coordinator.get_upcoming_birthdays(date(2023, 12, 20)), [])
+
+    def test_streamed_write_matches_and_cleans_up(self):
+        users = [{"name": f"User {i}", "birthday": f"{1950 + i % 60}.{i % 12 + 1:02d}.{i % 28 + 1:02d}"} for i in range(2000)]
+        with tempfile.TemporaryDirectory() as directory:
+            # A tiny buffer makes every shard append to its temporary files many times
+            with patch("shards.SPOOL_BUFFER_SIZE", 64):
+                self.assertEqual(write_shards(users, directory, shards=5), 2000)
+            self.assertFalse([name for name in os.listdir(directory) if name.endswith(".tmp")])
+            with LocalShardCluster(directory, workers=2) as cluster:
+                today = date(2024, 3, 10)
+                self.assertEqual(cluster.coordinator.get_upcoming_birthdays(today),
+                                 get_upcoming_birthdays_columnar(users, today).to_dicts())
+            # A bad user leaves the written directory as it was
+            before = {name: os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)}
+            with self.assertRaises(ValueError):
+                write_shards(users[:10] + [{"name": "Bad", "birthday": "1990.13.40"}], directory, shards=5)
+            self.assertEqual({name: os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)}, before)
+
+    def test_malformed_requests_get_error_replies(self):
+        authkey = b"secret"
+        address = self.start_worker(authkey)
+        connection = Client(address, authkey=authkey)
+        for request in ((), None, ("upcoming",), ("upcoming", 0, date(2024, 1, 1), "policy")):
+            with self.subTest(request=request):
+                connection.send(request)
+                self.assertEqual(connection.recv()[0], "error")
+        connection.send(("shutdown",))
+        self.assertEqual(connection.recv(), ("ok", None))
+        connection.close()
+
+if __name__ == '__main__':
+    unittest.main()
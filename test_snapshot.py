@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from snapshot import HEADER, RECORD, BirthdaySnapshot, write_snapshot
+from Task4 import get_upcoming_birthdays
+
+class TestBirthdaySnapshot(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "users.bday")
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+            {"name": "Олена Коваль", "birthday": "1991.01.22"},
+            {"name": "Future User", "birthday": "2025.01.23"},
+            {"name": "Leap Day User", "birthday": "1996.02.29"},
+        ]
+
+    @patch('Task4.datetime')
+    def test_matches_get_upcoming_birthdays(self, mock_datetime):
+        mock_datetime.today.return_value = datetime(2024, 1, 22)
+        mock_datetime.strptime = datetime.strptime
+        self.assertEqual(write_snapshot(self.users, self.path), 6)
+        with BirthdaySnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 6)
+            self.assertEqual(snapshot.get_upcoming_birthdays(datetime(2024, 1, 22).date()), get_upcoming_birthdays(self.users))
+
+    def test_names_and_indices(self):
+        write_snapshot(self.users, self.path)
+        with BirthdaySnapshot(self.path) as snapshot:
+            self.assertEqual([snapshot.name(i) for i in range(len(snapshot))], [user["name"] for user in self.users])
+            indices, ordinals = snapshot.upcoming_indices(datetime(2026, 2, 25).date())
+            self.assertEqual(list(indices), [5])
+            self.assertEqual(list(ordinals), [datetime(2026, 3, 1).toordinal()])
+
+    def test_empty_snapshot(self):
+        write_snapshot([], self.path)
+        with BirthdaySnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 0)
+            self.assertEqual(snapshot.get_upcoming_birthdays(datetime(2024, 1, 22).date()), [])
+
+    def test_not_a_snapshot(self):
+        with open(self.path, "wb") as file:
+            file.write(b"x" * 64)
+        with self.assertRaises(ValueError):
+            BirthdaySnapshot(self.path)
+
+    def test_truncated_snapshot(self):
+        write_snapshot(self.users, self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        names_offset = HEADER.unpack_from(data)[3]
+        # Cut inside the records, at the end of the records, and inside the names
+        for size in (HEADER.size + RECORD.size + 3, names_offset, len(data) - 1):
+            with self.subTest(size=size):
+                with open(self.path, "wb") as file:
+                    file.write(data[:size])
+                with self.assertRaisesRegex(ValueError, "truncated"):
+                    BirthdaySnapshot(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,12 @@
+import pickle
+import csv
+import json
+import os
+import tempfile
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
-from Task4 import get_upcoming_birthdays
+from Task4 import get_upcoming_birthdays, get_upcoming_birthdays_columnar, format_dates, adjust_weekend_date, congratulation_table, BirthdayPolicy, BirthdayCalendar, BirthdayIndex, UpcomingBirthdaysTracker, UserStore, read_users, write_upcoming_birthdays
 
 class TestGetUpcomingBirthdays(unittest.TestCase):
     """
@@ -228,5 +233,467 @@ class TestGetUpcomingBirthdays(unittest.TestCase):
         # Only the valid user should be included
         self.assertEqual(result, [{"name": "Valid User", "congratulation_date": "2024.01.23"}])
 
+    @patch('Task4.datetime')
+    def test_parallel_mode(self, mock_datetime):
+        """
+        Tests the process-pool mode.
+
+        Verifies that:
+        1. The parallel result is the same as the serial one, in the same order
+        2. Small lists stay serial below the threshold
+        """
+        mock_datetime.today.return_value = self.test_date
+        mock_datetime.strptime = datetime.strptime
+        users = self.users * 20
+        expected = get_upcoming_birthdays(users)
+        self.assertEqual(get_upcoming_birthdays(users, workers=2, parallel_threshold=1), expected)
+        with patch('concurrent.futures.ProcessPoolExecutor') as mock_executor:
+            self.assertEqual(get_upcoming_birthdays(users, workers=2), expected)
+            mock_executor.assert_not_called()
+
+class TestCongratulationTable(unittest.TestCase):
+    """
+    Tests for the per-day congratulation date table.
+    """
+
+    def test_window_entries(self):
+        """Every day in the window maps to its weekend-adjusted congratulation date."""
+        table = congratulation_table(datetime(2024, 1, 22).date())
+        self.assertEqual(len(table), 8)
+        self.assertEqual(table[(1, 22)], datetime(2024, 1, 22).date())
+        self.assertEqual(table[(1, 27)], datetime(2024, 1, 29).date())
+        self.assertEqual(table[(1, 28)], datetime(2024, 1, 29).date())
+        self.assertNotIn((1, 30), table)
+        self.assertNotIn((1, 21), table)
+
+    def test_leap_day_in_non_leap_year(self):
+        """February 29th shares February 28th's congratulation date in non-leap years."""
+        table = congratulation_table(datetime(2026, 2, 25).date())
+        self.assertEqual(table[(2, 29)], datetime(2026, 3, 1).date())
+        self.assertEqual(table[(2, 28)], table[(2, 29)])
+
+    def test_cached_per_day(self):
+        """The same table object is reused for the same day."""
+        today = datetime(2024, 1, 22).date()
+        self.assertIs(congratulation_table(today), congratulation_table(today))
+
+    def test_table_is_read_only(self):
+        """Callers cannot change the shared cached table."""
+        table = congratulation_table(datetime(2024, 1, 22).date())
+        with self.assertRaises(TypeError):
+            table[(1, 23)] = datetime(2000, 1, 1).date()
+        self.assertEqual(table[(1, 23)], datetime(2024, 1, 23).date())
+
+class TestBirthdayPolicy(unittest.TestCase):
+    """
+    Tests for configurable windows, weekend days and holidays.
+    """
+
+    def test_default_matches_adjust_weekend_date(self):
+        """The default policy moves dates exactly like adjust_weekend_date, including Saturday Feb 28th."""
+        policy = BirthdayPolicy()
+        day = datetime(2023, 1, 1).date()
+        for _ in range(4 * 366):
+            self.assertEqual(policy.congratulation_date(day), adjust_weekend_date(day))
+            day += timedelta(days=1)
+
+    def test_long_window_with_holidays(self):
+        """A 30-day window moves holidays and weekends to the next business day."""
+        policy = BirthdayPolicy(window_days=30, holidays={datetime(2024, 2, 12).date(), datetime(2024, 2, 13).date()})
+        users = [
+            {"name": "Near", "birthday": "1990.01.23"},
+            {"name": "Holiday", "birthday": "1990.02.12"},
+            {"name": "Weekend Before Holiday", "birthday": "1990.02.11"},
+            {"name": "Day 30", "birthday": "1990.02.21"},
+            {"name": "Day 31", "birthday": "1990.02.22"},
+        ]
+        with patch('Task4.datetime') as mock_datetime:
+            mock_datetime.today.return_value = datetime(2024, 1, 22)
+            mock_datetime.strptime = datetime.strptime
+            result = get_upcoming_birthdays(users, policy=policy)
+        self.assertEqual(result, [
+            {"name": "Near", "congratulation_date": "2024.01.23"},
+            {"name": "Holiday", "congratulation_date": "2024.02.14"},
+            {"name": "Weekend Before Holiday", "congratulation_date": "2024.02.14"},
+            {"name": "Day 30", "congratulation_date": "2024.02.21"},
+        ])
+
+    def test_saturday_feb28_next_day_skips_holidays(self):
+        """The Saturday Feb 28th special case still moves past a holiday on the next day."""
+        saturday = datetime(2026, 2, 28).date()
+        self.assertEqual(BirthdayPolicy().congratulation_date(saturday), datetime(2026, 3, 1).date())
+        policy = BirthdayPolicy(holidays={datetime(2026, 3, 1).date()})
+        self.assertEqual(policy.congratulation_date(saturday), datetime(2026, 3, 2).date())
+        policy = BirthdayPolicy(holidays={datetime(2026, 3, 1).date(), datetime(2026, 3, 2).date()})
+        self.assertEqual(policy.congratulation_date(saturday), datetime(2026, 3, 3).date())
+
+    def test_custom_weekend(self):
+        """Friday/Saturday weekends move congratulations to Sunday."""
+        policy = BirthdayPolicy(weekend_days={4, 5}, saturday_feb28_next_day=False)
+        table = congratulation_table(datetime(2024, 1, 22).date(), policy)
+        self.assertEqual(table[(1, 26)], datetime(2024, 1, 28).date())  # Friday -> Sunday
+        self.assertEqual(table[(1, 27)], datetime(2024, 1, 28).date())  # Saturday -> Sunday
+        self.assertEqual(table[(1, 29)], datetime(2024, 1, 29).date())
+        self.assertEqual(BirthdayIndex([{"name": "A", "birthday": "1990.01.26"}]).get_upcoming_birthdays(
+            datetime(2024, 1, 22).date(), policy), [{"name": "A", "congratulation_date": "2024.01.28"}])
+
+    def test_long_window_uses_next_birthday(self):
+        """When a year-long window sees a day twice, the nearer birthday wins."""
+        table = congratulation_table(datetime(2024, 1, 22).date(), BirthdayPolicy(window_days=365))
+        self.assertEqual(table[(1, 22)], datetime(2024, 1, 22).date())
+        self.assertEqual(table[(2, 29)], datetime(2024, 2, 29).date())
+
+    def test_policy_is_a_value_not_a_tuple(self):
+        """Policies compare and hash by their fields, are immutable, and are not tuples."""
+        policy = BirthdayPolicy(window_days=10, holidays=[datetime(2024, 1, 1).date()])
+        self.assertEqual(policy, BirthdayPolicy(window_days=10, holidays={datetime(2024, 1, 1).date()}))
+        self.assertEqual(hash(policy), hash(BirthdayPolicy(window_days=10, holidays={datetime(2024, 1, 1).date()})))
+        self.assertNotEqual(policy, BirthdayPolicy())
+        self.assertNotEqual(BirthdayPolicy(), (7, frozenset({5, 6}), frozenset(), True))
+        with self.assertRaises(TypeError):
+            policy[0]
+        with self.assertRaises(AttributeError):
+            policy.window_days = 3
+        self.assertEqual(pickle.loads(pickle.dumps(policy)), policy)
+        self.assertIn("window_days=10", repr(policy))
+
+    def test_invalid_policy(self):
+        """Impossible policies are rejected."""
+        with self.assertRaises(ValueError):
+            BirthdayPolicy(window_days=-1)
+        with self.assertRaises(ValueError):
+            BirthdayPolicy(weekend_days=range(7))
+        with self.assertRaises(ValueError):
+            BirthdayPolicy(weekend_days={7})
+
+class TestBirthdayIndex(unittest.TestCase):
+    """
+    Tests for BirthdayIndex, which must give the same results as get_upcoming_birthdays.
+    """
+
+    def setUp(self):
+        self.today = datetime(2024, 1, 22).date()  # Monday
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Bob Wilson", "birthday": "1988.01.28"},
+            {"name": "Alice Brown", "birthday": "1992.01.29"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+            {"name": "Eve Johnson", "birthday": "1995.01.21"},
+            {"name": "Frank Miller", "birthday": "1991.01.22"},
+            {"name": "Future User", "birthday": "2025.01.23"},
+        ]
+
+    @patch('Task4.datetime')
+    def test_matches_get_upcoming_birthdays(self, mock_datetime):
+        """The index returns the same users and dates as the list-based function."""
+        mock_datetime.today.return_value = datetime(2024, 1, 22)
+        mock_datetime.strptime = datetime.strptime
+        expected = get_upcoming_birthdays(self.users)
+        result = BirthdayIndex(self.users).get_upcoming_birthdays(self.today)
+        key = lambda x: x["name"]
+        self.assertEqual(sorted(result, key=key), sorted(expected, key=key))
+
+    def test_add_and_remove(self):
+        """Users can be added and removed without rebuilding the index."""
+        index = BirthdayIndex(self.users)
+        self.assertEqual(len(index), 8)
+        index.remove({"name": "John Doe", "birthday": "1985.01.23"})
+        index.add({"name": "New User", "birthday": "2000.01.24"})
+        names = [user["name"] for user in index.get_upcoming_birthdays(self.today)]
+        self.assertNotIn("John Doe", names)
+        self.assertIn("New User", names)
+        self.assertEqual(len(index), 8)
+        with self.assertRaises(ValueError):
+            index.remove({"name": "John Doe", "birthday": "1985.01.23"})
+
+    def test_leap_day_in_non_leap_year(self):
+        """February 29th birthdays are found through February 28th in non-leap years."""
+        index = BirthdayIndex([{"name": "Leap Weekend User", "birthday": "1996.02.29"}])
+        self.assertEqual(
+            index.get_upcoming_birthdays(datetime(2026, 2, 25).date()),
+            [{"name": "Leap Weekend User", "congratulation_date": "2026.03.01"}],
+        )
+        self.assertEqual(
+            index.get_upcoming_birthdays(datetime(2032, 2, 25).date()),
+            [{"name": "Leap Weekend User", "congratulation_date": "2032.03.01"}],
+        )
+
+class TestUpcomingBirthdaysTracker(unittest.TestCase):
+    """
+    Tests for the incremental UpcomingBirthdaysTracker.
+    """
+
+    def setUp(self):
+        self.today = datetime(2024, 1, 22).date()  # Monday
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+            {"name": "Frank Miller", "birthday": "1991.01.22"},
+            {"name": "Born Tomorrow", "birthday": "2024.01.23"},
+        ]
+        self.tracker = UpcomingBirthdaysTracker(self.users, self.today)
+
+    def test_initial_results(self):
+        """The tracker starts with the same result as the index."""
+        self.assertEqual(self.tracker.results(), BirthdayIndex(self.users).get_upcoming_birthdays(self.today))
+
+    def test_advance_one_day(self):
+        """Moving one day drops the day that left and adds the day that entered."""
+        events = self.tracker.advance(datetime(2024, 1, 23).date())
+        self.assertCountEqual(events, [
+            ("removed", {"name": "Frank Miller", "congratulation_date": "2024.01.22"}),
+            ("added", {"name": "Charlie Davis", "congratulation_date": "2024.01.30"}),
+            ("added", {"name": "Born Tomorrow", "congratulation_date": "2024.01.23"}),
+        ])
+        self.assertEqual(self.tracker.advance(datetime(2024, 1, 23).date()), [])
+
+    def test_advance_matches_full_recompute(self):
+        """After any number of days the result equals a fresh computation."""
+        today = self.today
+        for _ in range(400):
+            today += timedelta(days=1)
+            self.tracker.advance(today)
+            expected = BirthdayIndex(self.users).get_upcoming_birthdays(today)
+            key = lambda x: x["name"]
+            self.assertEqual(sorted(self.tracker.results(), key=key), sorted(expected, key=key))
+
+    def test_advance_rebuilds_only_changed_days(self):
+        """A one-day move rebuilds the day that entered and today's day (people born today)."""
+        with patch.object(self.tracker, "_bucket_results", wraps=self.tracker._bucket_results) as rebuild:
+            self.tracker.advance(datetime(2024, 1, 23).date())
+        self.assertCountEqual([call.args[0] for call in rebuild.call_args_list], [(1, 30), (1, 23)])
+
+    def test_jumps_match_full_recompute(self):
+        """Moves backwards, across years and longer than a year give the same result as a fresh computation."""
+        users = self.users + [{"name": "Leap Day", "birthday": "1996.02.29"}, {"name": "Born Later", "birthday": "2025.03.01"}]
+        policy = BirthdayPolicy(window_days=40, holidays=frozenset({datetime(2025, 3, 3).date()}))
+        tracker = UpcomingBirthdaysTracker(users, self.today, policy)
+        key = lambda x: x["name"]
+        for today in ("2024.02.25", "2025.02.20", "2025.03.05", "2025.02.27", "2023.12.30", "2027.02.26", "2025.02.28"):
+            today = datetime.strptime(today, "%Y.%m.%d").date()
+            with self.subTest(today=today):
+                tracker.advance(today)
+                expected = BirthdayIndex(users).get_upcoming_birthdays(today, policy)
+                self.assertEqual(sorted(tracker.results(), key=key), sorted(expected, key=key))
+
+    def test_add_remove_update(self):
+        """Single-user changes produce single events."""
+        new_user = {"name": "New User", "birthday": "2000.01.24"}
+        self.assertEqual(self.tracker.add(new_user), [("added", {"name": "New User", "congratulation_date": "2024.01.24"})])
+        self.assertEqual(self.tracker.add({"name": "Far User", "birthday": "2000.06.01"}), [])
+        self.assertEqual(self.tracker.remove({"name": "John Doe", "birthday": "1985.01.23"}),
+                         [("removed", {"name": "John Doe", "congratulation_date": "2024.01.23"})])
+        events = self.tracker.update(new_user, {"name": "New User", "birthday": "2000.01.28"})
+        self.assertEqual(events, [
+            ("removed", {"name": "New User", "congratulation_date": "2024.01.24"}),
+            ("added", {"name": "New User", "congratulation_date": "2024.01.29"}),
+        ])
+        with self.assertRaises(ValueError):
+            self.tracker.remove({"name": "John Doe", "birthday": "1985.01.23"})
+
+    def test_invalid_update_keeps_user(self):
+        """An update with an invalid new birthday raises and leaves the old user in place."""
+        before = self.tracker.results()
+        size = len(self.tracker.index)
+        old_user = {"name": "John Doe", "birthday": "1985.01.23"}
+        with self.assertRaises(ValueError):
+            self.tracker.update(old_user, {"name": "John Doe", "birthday": "1990.13.40"})
+        with self.assertRaises(KeyError):
+            self.tracker.update(old_user, {"birthday": "1985.01.24"})
+        self.assertEqual(self.tracker.results(), before)
+        self.assertEqual(len(self.tracker.index), size)
+
+    def test_index_users_on(self):
+        """BirthdayIndex.users_on lists the users of one day in insertion order."""
+        self.assertEqual(self.tracker.index.users_on(1, 23), (("John Doe", datetime(1985, 1, 23).date()),
+                                                              ("Born Tomorrow", datetime(2024, 1, 23).date())))
+        self.assertEqual(self.tracker.index.users_on(6, 1), ())
+
+class TestUserStore(unittest.TestCase):
+    """
+    Tests for the columnar UserStore.
+    """
+
+    def setUp(self):
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+            {"name": "Frank Miller", "birthday": "1991.01.22"},
+            {"name": "Future User", "birthday": "2024.01.23"},
+            {"name": "Born Today", "birthday": "2024.01.22"},
+        ]
+
+    @patch('Task4.datetime')
+    def test_matches_get_upcoming_birthdays(self, mock_datetime):
+        """The store returns the same results, in the same order, as the list-based function."""
+        mock_datetime.today.return_value = datetime(2024, 1, 22)
+        mock_datetime.strptime = datetime.strptime
+        store = UserStore(self.users)
+        self.assertEqual(len(store), 6)
+        self.assertEqual(store.get_upcoming_birthdays(), get_upcoming_birthdays(self.users))
+
+    def test_index_views(self):
+        """The query returns user indices and congratulation date ordinals."""
+        store = UserStore(self.users)
+        indices, ordinals = store.upcoming_indices(datetime(2024, 1, 22).date())
+        self.assertEqual(list(indices), [0, 1, 3, 5])
+        self.assertEqual(ordinals[1], datetime(2024, 1, 29).toordinal())
+
+    def test_leap_day(self):
+        """February 29th birthdays use the same rules as get_birthday_this_year."""
+        store = UserStore([{"name": "Leap Weekend User", "birthday": "1996.02.29"}])
+        self.assertEqual(
+            store.get_upcoming_birthdays(datetime(2026, 2, 25).date()),
+            [{"name": "Leap Weekend User", "congratulation_date": "2026.03.01"}],
+        )
+
+class TestBirthdayCalendar(unittest.TestCase):
+    """
+    Tests for date-range queries (BirthdayCalendar).
+    """
+
+    def setUp(self):
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},   # Saturday in 2024
+            {"name": "Bob Wilson", "birthday": "1988.01.28"},   # Sunday in 2024
+            {"name": "Alice Brown", "birthday": "1992.01.29"},
+            {"name": "New Year", "birthday": "1992.12.31"},
+            {"name": "Leap Day User", "birthday": "1996.02.29"},
+            {"name": "Born 2024", "birthday": "2024.01.25"},
+        ]
+        self.calendar = BirthdayCalendar(self.users)
+
+    def test_counts(self):
+        """Counts include weekend shifts and skip users not yet born."""
+        day = lambda month, day, year=2024: datetime(year, month, day).date()
+        self.assertEqual(self.calendar.count(day(1, 29), day(1, 29)), 3)
+        self.assertEqual(self.calendar.count(day(1, 27), day(1, 28)), 0)
+        # Sunday 2023.12.31 is moved into January 2024, Saturday 2022.12.31 into January 2023
+        self.assertEqual(self.calendar.count(day(1, 1), day(1, 31)), 6)
+        self.assertEqual(self.calendar.count(day(1, 1, 2023), day(1, 31, 2023)), 5)
+        self.assertEqual(self.calendar.count(day(1, 1), day(12, 31)), 8)
+        self.assertEqual(self.calendar.count(day(1, 31), day(1, 1)), 0)
+
+    def test_counts_by_day(self):
+        """Per-day counts add up to the range count."""
+        start, end = datetime(2024, 1, 1).date(), datetime(2024, 3, 31).date()
+        counts = self.calendar.counts_by_day(start, end)
+        self.assertEqual(len(counts), 91)
+        self.assertEqual(sum(counts.values()), self.calendar.count(start, end))
+        self.assertEqual(counts[datetime(2024, 2, 29).date()], 1)
+
+    def test_between(self):
+        """Listings are ordered by congratulation date and cross year boundaries."""
+        result = self.calendar.between(datetime(2025, 12, 29).date(), datetime(2026, 3, 1).date())
+        self.assertEqual(result, [
+            {"name": "New Year", "congratulation_date": "2025.12.31"},
+            {"name": "John Doe", "congratulation_date": "2026.01.23"},
+            {"name": "Born 2024", "congratulation_date": "2026.01.26"},
+            {"name": "Jane Smith", "congratulation_date": "2026.01.27"},
+            {"name": "Bob Wilson", "congratulation_date": "2026.01.28"},
+            {"name": "Alice Brown", "congratulation_date": "2026.01.29"},
+            {"name": "Leap Day User", "congratulation_date": "2026.03.01"},
+        ])
+        self.assertEqual(len(result), self.calendar.count(datetime(2025, 12, 29).date(), datetime(2026, 3, 1).date()))
+
+    def test_add_invalidates_counts(self):
+        """Added users are counted in later queries."""
+        start, end = datetime(2024, 5, 1).date(), datetime(2024, 5, 31).date()
+        self.assertEqual(self.calendar.count(start, end), 0)
+        self.calendar.add({"name": "May User", "birthday": "1999.05.15"})
+        self.assertEqual(self.calendar.count(start, end), 1)
+
+class TestColumnarResults(unittest.TestCase):
+    """
+    Tests for the columnar result (UpcomingColumns).
+    """
+
+    def setUp(self):
+        self.today = datetime(2024, 1, 22).date()
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+            {"name": "Bob Wilson", "birthday": "1988.01.28"},
+            {"name": "Future User", "birthday": "2025.01.23"},
+        ]
+
+    @patch('Task4.datetime')
+    def test_matches_get_upcoming_birthdays(self, mock_datetime):
+        """The columns hold the same users and dates as the list of dictionaries."""
+        mock_datetime.today.return_value = datetime(2024, 1, 22)
+        mock_datetime.strptime = datetime.strptime
+        columns = get_upcoming_birthdays_columnar(self.users)
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(list(columns.indices), [0, 1, 3])
+        self.assertEqual(columns.names(), ["John Doe", "Jane Smith", "Bob Wilson"])
+        self.assertEqual(columns.dates(), ["2024.01.23", "2024.01.29", "2024.01.29"])
+        self.assertEqual(columns.to_dicts(), get_upcoming_birthdays(self.users))
+
+    def test_user_store_columns(self):
+        """UserStore returns the same columns."""
+        columns = UserStore(self.users).upcoming(self.today)
+        self.assertEqual(columns.to_dicts(), get_upcoming_birthdays_columnar(self.users, self.today).to_dicts())
+
+    def test_format_dates(self):
+        """Repeated ordinals share one formatted string."""
+        ordinal = datetime(2024, 1, 29).toordinal()
+        strings = format_dates([ordinal, ordinal + 1, ordinal])
+        self.assertEqual(strings, ["2024.01.29", "2024.01.30", "2024.01.29"])
+        self.assertIs(strings[0], strings[2])
+
+class TestStreamingPipeline(unittest.TestCase):
+    """
+    Tests for the file-based pipeline (read_users / write_upcoming_birthdays).
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.users = [
+            {"name": "John Doe", "birthday": "1985.01.23"},
+            {"name": "Jane Smith", "birthday": "1990.01.27"},
+            {"name": "Charlie Davis", "birthday": "1987.01.30"},
+        ]
+        self.csv_path = os.path.join(self.directory.name, "users.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as file:
+            file.write("name,birthday\n")
+            for user in self.users:
+                file.write(f"{user['name']},{user['birthday']}\n")
+        self.jsonl_path = os.path.join(self.directory.name, "users.jsonl")
+        with open(self.jsonl_path, "w", encoding="utf-8") as file:
+            for user in self.users:
+                file.write(json.dumps(user) + "\n")
+
+    def test_read_users(self):
+        """Both CSV and JSONL inputs are read back as user dictionaries."""
+        self.assertEqual(list(read_users(self.csv_path)), self.users)
+        self.assertEqual(list(read_users(self.jsonl_path)), self.users)
+        with self.assertRaises(ValueError):
+            list(read_users(os.path.join(self.directory.name, "users.txt")))
+
+    @patch('Task4.datetime')
+    def test_write_upcoming_birthdays(self, mock_datetime):
+        """Upcoming congratulation dates are written straight to the output file."""
+        mock_datetime.today.return_value = datetime(2024, 1, 22)
+        mock_datetime.strptime = datetime.strptime
+        expected = [
+            {"name": "John Doe", "congratulation_date": "2024.01.23"},
+            {"name": "Jane Smith", "congratulation_date": "2024.01.29"},
+        ]
+        output_path = os.path.join(self.directory.name, "upcoming.jsonl")
+        self.assertEqual(write_upcoming_birthdays(self.csv_path, output_path), 2)
+        with open(output_path, encoding="utf-8") as file:
+            self.assertEqual([json.loads(line) for line in file], expected)
+
+        output_path = os.path.join(self.directory.name, "upcoming.csv")
+        self.assertEqual(write_upcoming_birthdays(self.jsonl_path, output_path), 2)
+        with open(output_path, encoding="utf-8") as file:
+            self.assertEqual(list(csv.DictReader(file)), expected)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
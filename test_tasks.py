@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import unittest
+import tasks
+import Task3
+
+def run_python(code: str) -> str:
+    """Run code in a fresh interpreter from this directory and return its stdout."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+class TestLazyPackage(unittest.TestCase):
+    def test_import_loads_no_task_module(self):
+        output = run_python("import sys, tasks; print(sorted(m for m in sys.modules if m.startswith('Task')))")
+        self.assertEqual(output.strip(), "[]")
+
+    def test_attribute_loads_only_its_module(self):
+        code = "import sys, tasks; tasks.normalize_phone; print(sorted(m for m in sys.modules if m.startswith('Task')))"
+        self.assertEqual(run_python(code).strip(), "['Task3']")
+
+    def test_attributes(self):
+        self.assertIs(tasks.normalize_phone, Task3.normalize_phone)
+        self.assertIs(tasks.Task3, Task3)
+        self.assertIn("get_upcoming_birthdays", dir(tasks))
+        with self.assertRaises(AttributeError):
+            tasks.missing_function
+
+    def test_every_export_resolves(self):
+        for name, module_name in tasks._EXPORTS.items():
+            with self.subTest(name=name):
+                self.assertIs(getattr(tasks, name), getattr(getattr(tasks, module_name), name))
+
+    def test_no_side_effects_or_heavy_imports(self):
+        code = ("import sys, Task1, Task2, Task3; "
+                "print(sorted(m for m in ('re', 'csv', 'json', 'calendar', 'typing', 'concurrent.futures') if m in sys.modules))")
+        self.assertEqual(run_python(code).strip(), "[]")
+        # Task4 uses calendar.isleap, which imports re through locale
+        code = ("import sys, Task4; "
+                "print(sorted(m for m in ('csv', 'json', 'typing', 'concurrent.futures') if m in sys.modules))")
+        self.assertEqual(run_python(code).strip(), "[]")
+
+    def test_serial_paths_do_not_import_concurrent_futures(self):
+        code = ("import os, sys, tempfile, Task3, Task4\n"
+                "with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:\n"
+                "    file.write('0501234567\\n')\n"
+                "Task3.normalize_phones_unique(file.name)\n"
+                "os.remove(file.name)\n"
+                "Task4.get_upcoming_birthdays([{'name': 'A', 'birthday': '1990.01.01'}])\n"
+                "print('concurrent.futures' in sys.modules)")
+        self.assertEqual(run_python(code).strip(), "False")
+
+if __name__ == '__main__':
+    unittest.main()